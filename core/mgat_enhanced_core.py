@@ -9,15 +9,68 @@ Author: Hillary Danan
 Framework: https://github.com/HillaryDanan/multi-geometric-attention
 “””
 
+import math
 import numpy as np
-import matplotlib.pyplot as plt
+from scipy.special import softmax, xlogy
 from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
 import warnings
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels fall back to plain Python
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 warnings.filterwarnings(‘ignore’)
 
 # ============================================================================
 
+# SPECIALIZED MEASUREMENT KERNELS
+
+# ============================================================================
+
+# Below this size a BLAS call costs more than the arithmetic it performs
+UNROLL_MAX_DIM = 32
+_MEASURE_KERNELS = {}
+
+def _make_measure_kernel(dim: int):
+“””
+Build a fused matvec + normalize kernel with dim baked in as a
+compile-time constant, letting LLVM fully unroll the loops.
+Returns None when numba is unavailable or dim is too large
+“””
+
+```
+if not NUMBA_AVAILABLE or dim > UNROLL_MAX_DIM:
+    return None
+
+if dim not in _MEASURE_KERNELS:
+    @njit(fastmath=True)
+    def kernel(P, x, out):
+        sq_norm = 0.0
+        for i in range(dim):
+            acc = 0.0
+            for j in range(dim):
+                acc += P[i, j] * x[j]
+            out[i] = acc
+            sq_norm += acc * acc
+        scale = 1.0 / max(math.sqrt(sq_norm), 1e-8)
+        for i in range(dim):
+            out[i] *= scale
+        return out
+    
+    _MEASURE_KERNELS[dim] = kernel
+
+return _MEASURE_KERNELS[dim]
+```
+
+# ============================================================================
+
 # CORE GEOMETRIC PATTERNS
 
 # ============================================================================
@@ -30,6 +83,15 @@ pattern_matrix: np.ndarray
 entropy: float
 connectivity: float
 
+@dataclass
+class TransformResults:
+“”“Per-geometry measurements stored as aligned arrays (row k is names[k])”””
+names: Tuple[str, ...]
+states: np.ndarray          # (geometries, dim)
+entropies: np.ndarray       # (geometries,)
+connectivities: np.ndarray  # (geometries,)
+patterns: np.ndarray        # (geometries, dim, dim)
+
 class GeometricAttention:
 “””
 Core MGAT implementation: Different geometric patterns of attention
@@ -40,42 +102,55 @@ transform neural representations into distinct conscious states
 def __init__(self, dim: int = 8):
     self.dim = dim
     self.patterns = self._initialize_patterns()
+    self.order = tuple(self.patterns)
+    self.pattern_stack = np.stack([self.patterns[k].pattern_matrix for k in self.order])
+    self._measure_kernel = _make_measure_kernel(dim)
     
-def _initialize_patterns(self) -> Dict[str, np.ndarray]:
-    """Initialize the four fundamental geometric attention patterns"""
+def _initialize_patterns(self) -> Dict[str, AttentionGeometry]:
+    """
+    Initialize the four fundamental geometric attention patterns
+    Patterns are fixed after construction, so their entropy and
+    connectivity are computed once here
+    """
     
     patterns = {}
-    
+
+    # Row/column index grids shared by the structured patterns
+    idx = np.arange(self.dim)
+    i = idx[:, None]
+    j = idx[None, :]
+    offset = np.abs(i - j)
+
     # 1. Sequential/Square Pattern (focused, linear processing)
-    sequential = np.zeros((self.dim, self.dim))
-    for i in range(self.dim):
-        for j in range(max(0, i-1), min(self.dim, i+2)):
-            sequential[i, j] = 1.0 / (1 + abs(i - j))
+    sequential = np.where(offset <= 1, 1.0 / (1 + offset), 0.0)
     patterns['sequential'] = sequential / sequential.sum(axis=1, keepdims=True)
-    
+
     # 2. Associative/Hexagonal Pattern (memory, pattern completion)
-    associative = np.ones((self.dim, self.dim))
-    for i in range(self.dim):
-        for j in range(self.dim):
-            dist = min(abs(i - j), self.dim - abs(i - j))  # Circular distance
-            associative[i, j] = np.exp(-0.5 * (dist / 2) ** 2)
+    dist = np.minimum(offset, self.dim - offset)  # Circular distance
+    associative = np.exp(-0.5 * (dist / 2) ** 2)
     patterns['associative'] = associative / associative.sum(axis=1, keepdims=True)
-    
+
     # 3. Hierarchical/Triangular Pattern (abstraction, categorization)
-    hierarchical = np.zeros((self.dim, self.dim))
-    for i in range(self.dim):
-        for j in range(i + 1):
-            hierarchical[i, j] = 1.0 / (i + 1)
-    patterns['hierarchical'] = hierarchical / (hierarchical.sum(axis=1, keepdims=True) + 1e-8)
+    # Row i spreads 1/(i+1) over its i+1 lower-triangular entries, so each
+    # row already sums to one
+    hierarchical = np.where(j <= i, 1.0 / (i + 1).astype(float), 0.0)
+    patterns['hierarchical'] = hierarchical
     
     # 4. Creative/Aperiodic Pattern (novel connections, insight)
     np.random.seed(42)  # For reproducibility
     creative = np.random.rand(self.dim, self.dim)
     creative = (creative + creative.T) / 2  # Symmetrize
-    creative = np.exp(creative) / np.exp(creative).sum(axis=1, keepdims=True)
-    patterns['creative'] = creative
+    patterns['creative'] = softmax(creative, axis=1)
     
-    return patterns
+    return {
+        name: AttentionGeometry(
+            name=name,
+            pattern_matrix=np.ascontiguousarray(pattern, dtype=np.float32),
+            entropy=self.compute_entropy(pattern),
+            connectivity=self.compute_connectivity(pattern)
+        )
+        for name, pattern in patterns.items()
+    }
 
 def measure(self, neural_state: np.ndarray, geometry: str) -> np.ndarray:
     """
@@ -85,21 +160,38 @@ def measure(self, neural_state: np.ndarray, geometry: str) -> np.ndarray:
     if geometry not in self.patterns:
         raise ValueError(f"Unknown geometry: {geometry}")
         
-    attention_matrix = self.patterns[geometry]
+    attention_matrix = self.patterns[geometry].pattern_matrix
+    
+    # Small single states go through the dim-specialized kernel
+    if self._measure_kernel is not None and neural_state.shape == (self.dim,):
+        out = np.empty(self.dim, dtype=np.result_type(attention_matrix, neural_state))
+        return self._measure_kernel(attention_matrix, np.ascontiguousarray(neural_state), out)
     
     # Attention as measurement: A|ψ⟩ = |φ⟩
     measured_state = attention_matrix @ neural_state
     
     # Normalize (collapse to measured state)
-    measured_state = measured_state / (np.linalg.norm(measured_state) + 1e-8)
+    measured_state *= 1.0 / max(np.linalg.norm(measured_state), 1e-8)
     
     return measured_state
 
+def measure_all(self, neural_state: np.ndarray) -> np.ndarray:
+    """
+    Apply every geometry to the same neural state in one batched matmul
+    Row k of the result is the measured state for self.order[k]
+    """
+    measured_states = self.pattern_stack @ neural_state
+    
+    # Normalize each measured state independently, in place
+    norms = np.linalg.norm(measured_states, axis=1, keepdims=True)
+    np.maximum(norms, 1e-8, out=norms)
+    measured_states /= norms
+    return measured_states
+
 def compute_entropy(self, pattern: np.ndarray) -> float:
     """Calculate Shannon entropy of attention pattern"""
-    flat = pattern.flatten()
-    flat = flat[flat > 0]
-    return -np.sum(flat * np.log2(flat + 1e-10))
+    # xlogy treats 0 * log(0) as 0, so no mask over zero entries is needed
+    return float(-xlogy(pattern, pattern).sum() / np.log(2.0))
 
 def compute_connectivity(self, pattern: np.ndarray) -> float:
     """Calculate connectivity measure of pattern"""
@@ -124,46 +216,18 @@ attention = GeometricAttention(dim=16)
 
 # Create initial neural state (superposition of features)
 np.random.seed(123)
-initial_state = np.random.randn(16)
+initial_state = np.random.randn(16).astype(np.float32)
 initial_state = initial_state / np.linalg.norm(initial_state)
 
-# Apply different geometric measurements
-results = {}
-for geometry in ['sequential', 'associative', 'hierarchical', 'creative']:
-    measured = attention.measure(initial_state, geometry)
-    entropy = attention.compute_entropy(attention.patterns[geometry])
-    connectivity = attention.compute_connectivity(attention.patterns[geometry])
-    
-    results[geometry] = {
-        'state': measured,
-        'entropy': entropy,
-        'connectivity': connectivity,
-        'pattern': attention.patterns[geometry]
-    }
-
-# Visualize transformations
-fig, axes = plt.subplots(2, 4, figsize=(16, 8))
-
-for idx, (name, data) in enumerate(results.items()):
-    # Plot attention pattern
-    ax1 = axes[0, idx]
-    im = ax1.imshow(data['pattern'], cmap='viridis', aspect='auto')
-    ax1.set_title(f'{name.capitalize()} Pattern\nH={data["entropy"]:.2f}, C={data["connectivity"]:.2f}')
-    ax1.set_xlabel('Input Dimension')
-    ax1.set_ylabel('Output Dimension')
-    plt.colorbar(im, ax=ax1, fraction=0.046)
-    
-    # Plot resulting state
-    ax2 = axes[1, idx]
-    ax2.bar(range(len(data['state'])), data['state'])
-    ax2.set_title(f'Measured State')
-    ax2.set_xlabel('Feature')
-    ax2.set_ylabel('Activation')
-    ax2.set_ylim([-0.5, 0.5])
-
-plt.suptitle('MGAT: Geometric Attention as Measurement Operator', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.show()
+# Apply all geometric measurements at once
+geometries = [attention.patterns[k] for k in attention.order]
+results = TransformResults(
+    names=attention.order,
+    states=attention.measure_all(initial_state),
+    entropies=np.array([g.entropy for g in geometries]),
+    connectivities=np.array([g.connectivity for g in geometries]),
+    patterns=attention.pattern_stack
+)
 
 return results
 ```
@@ -174,6 +238,25 @@ return results
 
 # ============================================================================
 
+@njit(cache=True, fastmath=True)
+def run_dynamics(state, pattern_stack, mode_ids):
+“””
+Repeatedly measure a neural state, applying pattern_stack[mode_ids[t]]
+at timestep t. Returns the (dim, timesteps) matrix of states
+“””
+
+```
+timesteps = mode_ids.shape[0]
+states_matrix = np.empty((state.shape[0], timesteps), dtype=state.dtype)
+
+for t in range(timesteps):
+    state = pattern_stack[mode_ids[t]] @ state
+    state *= 1.0 / max(np.linalg.norm(state), 1e-8)
+    states_matrix[:, t] = state
+
+return states_matrix
+```
+
 def demonstrate_attention_dynamics():
 “””
 Show how attention can transition between geometric modes,
@@ -193,24 +276,72 @@ mode_sequence = (
 )
 
 # Initialize state
-state = np.random.randn(12)
+state = np.random.randn(12).astype(np.float32)
 state = state / np.linalg.norm(state)
 
 # Track evolution
-states = []
-entropies = []
+key_to_id = {name: k for k, name in enumerate(attention.order)}
+mode_ids = np.fromiter((key_to_id[mode] for mode in mode_sequence),
+                       dtype=np.int64, count=timesteps)
+entropy_arr = np.array([attention.patterns[k].entropy for k in attention.order],
+                       dtype=np.float32)
 
-for t in range(timesteps):
-    mode = mode_sequence[t]
-    state = attention.measure(state, mode)
-    states.append(state.copy())
-    entropies.append(attention.compute_entropy(attention.patterns[mode]))
+states_matrix = run_dynamics(state, attention.pattern_stack, mode_ids)
+entropies = entropy_arr[mode_ids]
+
+return states_matrix, entropies
+```
+
+# ============================================================================
+
+# VISUALIZATION
+
+# ============================================================================
+
+def visualize_transformations(results: TransformResults, show: bool = False):
+“”“Plot each geometry’s attention pattern above the state it measures”””
+
+```
+import matplotlib.pyplot as plt
+
+fig, axes = plt.subplots(2, 4, figsize=(16, 8))
+
+for idx, name in enumerate(results.names):
+    # Plot attention pattern
+    ax1 = axes[0, idx]
+    im = ax1.imshow(results.patterns[idx], cmap='viridis', aspect='auto')
+    ax1.set_title(f'{name.capitalize()} Pattern\nH={results.entropies[idx]:.2f}, C={results.connectivities[idx]:.2f}')
+    ax1.set_xlabel('Input Dimension')
+    ax1.set_ylabel('Output Dimension')
+    plt.colorbar(im, ax=ax1, fraction=0.046)
+    
+    # Plot resulting state
+    ax2 = axes[1, idx]
+    ax2.bar(range(results.states.shape[1]), results.states[idx])
+    ax2.set_title(f'Measured State')
+    ax2.set_xlabel('Feature')
+    ax2.set_ylabel('Activation')
+    ax2.set_ylim([-0.5, 0.5])
+
+plt.suptitle('MGAT: Geometric Attention as Measurement Operator', fontsize=14, fontweight='bold')
+plt.tight_layout()
+
+# Non-interactive backends (e.g. MPLBACKEND=Agg) have nothing to show
+if show and plt.get_backend().lower() != 'agg':
+    plt.show()
+
+return fig
+```
+
+def visualize_dynamics(states_matrix: np.ndarray, entropies: np.ndarray, show: bool = False):
+“”“Plot the state trajectory and entropy trace from demonstrate_attention_dynamics”””
+
+```
+import matplotlib.pyplot as plt
 
-# Visualize dynamics
 fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
 
 # State evolution heatmap
-states_matrix = np.array(states).T
 im1 = ax1.imshow(states_matrix, cmap='RdBu_r', aspect='auto', vmin=-0.5, vmax=0.5)
 ax1.set_title('Neural State Evolution Under Geometric Attention Transitions')
 ax1.set_xlabel('Time')
@@ -234,9 +365,12 @@ for i, label in enumerate(mode_labels):
     ax2.text(12.5 + i*25, max(entropies)*0.9, label, ha='center')
 
 plt.tight_layout()
-plt.show()
 
-return states_matrix
+# Non-interactive backends (e.g. MPLBACKEND=Agg) have nothing to show
+if show and plt.get_backend().lower() != 'agg':
+    plt.show()
+
+return fig
 ```
 
 # ============================================================================
@@ -257,10 +391,12 @@ print(”-” * 70)
 print("\n1. GEOMETRIC TRANSFORMATIONS")
 print("   Showing how different attention patterns transform neural states")
 transformation_results = demonstrate_geometric_transformations()
+visualize_transformations(transformation_results, show=True)
 
 print("\n2. ATTENTION DYNAMICS") 
 print("   Modeling transitions between attention modes over time")
-dynamics_results = demonstrate_attention_dynamics()
+dynamics_results, dynamics_entropies = demonstrate_attention_dynamics()
+visualize_dynamics(dynamics_results, dynamics_entropies, show=True)
 
 print("\n" + "=" * 70)
 print("KEY INSIGHTS:")
@@ -15,15 +15,80 @@ Key phenomena modeled:
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import signal, stats
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import matplotlib.patches as patches
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ============================================================================
 
 # BINOCULAR RIVALRY MODEL
 
 # ============================================================================
 
+@njit(cache=True)
+def _simulate_core(duration, tau_adapt, noise_arr):
+“””
+Winner-take-all rivalry recurrence with adaptation
+noise_arr holds the pre-drawn (duration, 2) left/right eye noise
+Returns (states, switch times, dominance durations)
+“””
+
+```
+# Initialize competing states (left eye vs right eye)
+state_L = 1.0  # Left eye dominance
+state_R = 0.0  # Right eye dominance
+adaptation_L = 0.0
+adaptation_R = 0.0
+dominant_L = True
+
+states = np.empty((duration, 2))
+switches = np.empty(duration, dtype=np.int64)
+n_switches = 0
+
+for t in range(duration):
+    # Competition with adaptation
+    effective_L = state_L - adaptation_L + noise_arr[t, 0]
+    effective_R = state_R - adaptation_R + noise_arr[t, 1]
+    
+    # Winner-take-all (attention selection)
+    if effective_L > effective_R:
+        state_L = min(1.0, state_L + 0.1)
+        state_R = max(0.0, state_R - 0.1)
+        adaptation_L += 1.0 / tau_adapt
+        adaptation_R *= 0.95  # Recovery
+        new_dominant_L = True
+    else:
+        state_R = min(1.0, state_R + 0.1)
+        state_L = max(0.0, state_L - 0.1)
+        adaptation_R += 1.0 / tau_adapt
+        adaptation_L *= 0.95
+        new_dominant_L = False
+    
+    # Record switch
+    if new_dominant_L != dominant_L:
+        switches[n_switches] = t
+        n_switches += 1
+        dominant_L = new_dominant_L
+    
+    states[t, 0] = state_L
+    states[t, 1] = state_R
+
+# Calculate dominance durations (key empirical measure)
+bounds = np.empty(n_switches + 2, dtype=np.int64)
+bounds[0] = 0
+bounds[1:-1] = switches[:n_switches]
+bounds[-1] = duration
+
+return states, switches[:n_switches], np.diff(bounds)
+```
+
 class BinocularRivalry:
 “””
 Models perceptual switching in binocular rivalry through
@@ -36,56 +101,18 @@ def __init__(self, tau_adapt: float = 2.0, noise_level: float = 0.1):
     self.noise = noise_level
     self.history = []
     
-def simulate(self, duration: int = 1000) -> Dict:
+def simulate(self, duration: int = 1000, seed: Optional[int] = None) -> Dict:
     """
     Simulate rivalry between two competing attention geometries
     Prediction: Switching rate correlates with geometric entropy difference
+    Pass a seed for a reproducible run
     """
     
-    # Initialize competing states (left eye vs right eye)
-    state_L = 1.0  # Left eye dominance
-    state_R = 0.0  # Right eye dominance
-    adaptation_L = 0.0
-    adaptation_R = 0.0
-    
-    states = []
-    switches = []
-    current_dominant = 'L'
-    
-    for t in range(duration):
-        # Add noise (stochastic resonance)
-        noise_L = np.random.randn() * self.noise
-        noise_R = np.random.randn() * self.noise
-        
-        # Competition with adaptation
-        effective_L = state_L - adaptation_L + noise_L
-        effective_R = state_R - adaptation_R + noise_R
-        
-        # Winner-take-all (attention selection)
-        if effective_L > effective_R:
-            state_L = min(1.0, state_L + 0.1)
-            state_R = max(0.0, state_R - 0.1)
-            adaptation_L += 1.0 / self.tau_adapt
-            adaptation_R *= 0.95  # Recovery
-            new_dominant = 'L'
-        else:
-            state_R = min(1.0, state_R + 0.1)
-            state_L = max(0.0, state_L - 0.1)
-            adaptation_R += 1.0 / self.tau_adapt
-            adaptation_L *= 0.95
-            new_dominant = 'R'
-        
-        # Record switch
-        if new_dominant != current_dominant:
-            switches.append(t)
-            current_dominant = new_dominant
-        
-        states.append([state_L, state_R])
-    
-    states = np.array(states)
+    # Add noise (stochastic resonance), drawn for both eyes up front
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((duration, 2)) * self.noise
     
-    # Calculate dominance durations (key empirical measure)
-    durations = np.diff([0] + switches + [duration])
+    states, switches, durations = _simulate_core(duration, self.tau_adapt, noise)
     
     # TESTABLE PREDICTION: Log-normal distribution of dominance durations
     # This is observed empirically and emerges from geometric competition
@@ -207,12 +234,9 @@ def plot_blink_curve(self):
     """Generate classic attentional blink curve"""
     
     lags = range(1, 9)
-    detection_rates = []
     
-    for lag in lags:
-        # Run multiple trials
-        trials = [self.simulate_rsvp(t2_lag=lag)['t2_detection'] for _ in range(100)]
-        detection_rates.append(np.mean(trials))
+    # simulate_rsvp is deterministic, so one trial per lag gives the exact rate
+    detection_rates = [self.simulate_rsvp(t2_lag=lag)['t2_detection'] for lag in lags]
     
     # Theoretical prediction from MGAT
     theoretical = []
@@ -275,29 +299,23 @@ def generate_hexagonal_pattern(self, size: int = 50) -> np.ndarray:
     angle2 = self.angle + np.pi/3
     
     # Basis vectors for hexagonal grid
-    v1 = np.array([np.cos(angle1), np.sin(angle1)]) * self.scale
-    v2 = np.array([np.cos(angle2), np.sin(angle2)]) * self.scale
+    v1 = (np.array([np.cos(angle1), np.sin(angle1)]) * self.scale).astype(np.float32)
+    v2 = (np.array([np.cos(angle2), np.sin(angle2)]) * self.scale).astype(np.float32)
     
-    # Generate grid
-    grid = np.zeros((size, size))
+    # Positions relative to center (rows are y, columns are x)
     center = size // 2
-    
-    for i in range(size):
-        for j in range(size):
-            # Position relative to center
-            x = (j - center) / 10
-            y = (i - center) / 10
-            pos = np.array([x, y])
-            
-            # Project onto hexagonal basis
-            proj1 = np.cos(2 * np.pi * np.dot(pos, v1))
-            proj2 = np.cos(2 * np.pi * np.dot(pos, v2))
-            proj3 = np.cos(2 * np.pi * np.dot(pos, v1 - v2))
-            
-            # Hexagonal activation (matches grid cells)
-            grid[i, j] = (proj1 + proj2 + proj3) / 3
-    
-    return grid
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32)
+    x = (x - center) / 10
+    y = (y - center) / 10
+    
+    # Project onto hexagonal basis
+    v3 = v1 - v2
+    proj1 = np.cos(2 * np.pi * (x * v1[0] + y * v1[1]))
+    proj2 = np.cos(2 * np.pi * (x * v2[0] + y * v2[1]))
+    proj3 = np.cos(2 * np.pi * (x * v3[0] + y * v3[1]))
+    
+    # Hexagonal activation (matches grid cells)
+    return (proj1 + proj2 + proj3) / 3
 
 def plot_grid_attention(self):
     """Visualize hexagonal attention matching grid cells"""
@@ -12,12 +12,21 @@ Key Concepts:
 - Gödel numbering analog: Encoding attention within attention
   “””
 
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple, Optional
 import networkx as nx
-from matplotlib.patches import FancyBboxPatch, Circle, FancyArrow
-import matplotlib.patches as mpatches
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels fall back to plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # ============================================================================
 
@@ -37,6 +46,14 @@ def __init__(self, levels: int = 4):
     self.hierarchy = self._build_tangled_hierarchy()
     self.self_symbol = None  # The "I" emerges here
     
+    # Attention kernels are fixed, so build them once. The associative
+    # kernel is the outer product of [1, 2, 1] / 4 with itself and is
+    # applied as two 1D passes; the hierarchical kernel is not separable.
+    self._assoc_1d = np.array([1.0, 2.0, 1.0]) / 4
+    self._hier_kernel = np.array([[0, 0, 1],
+                                  [0, 1, 1],
+                                  [1, 1, 1]]) / 5
+    
 def _build_tangled_hierarchy(self) -> Dict:
     """
     Build a tangled hierarchy where higher levels loop back to lower ones
@@ -110,19 +127,14 @@ def strange_loop_iteration(self, input_pattern: np.ndarray) -> Dict:
 def _attend_to_level(self, pattern: np.ndarray, geometry: str) -> np.ndarray:
     """Apply geometric attention transformation"""
     if geometry == 'associative':
-        # Distributed, memory-like processing
-        kernel = np.array([[0.5, 1, 0.5],
-                          [1, 2, 1],
-                          [0.5, 1, 0.5]]) / 8
-    else:  # hierarchical
-        # Bottom-up integration
-        kernel = np.array([[0, 0, 1],
-                          [0, 1, 1],
-                          [1, 1, 1]]) / 5
-    
-    # Convolve for attention effect
+        # Distributed, memory-like processing (separable blur)
+        from scipy.ndimage import convolve1d
+        attended = convolve1d(pattern, self._assoc_1d, axis=0, mode='wrap')
+        return convolve1d(attended, self._assoc_1d, axis=1, mode='wrap')
+    
+    # Hierarchical: bottom-up integration
     from scipy.signal import convolve2d
-    attended = convolve2d(pattern, kernel, mode='same', boundary='wrap')
+    attended = convolve2d(pattern, self._hier_kernel, mode='same', boundary='wrap')
     return attended
 
 def _create_self_symbol(self, levels: List[np.ndarray]) -> np.ndarray:
@@ -131,10 +143,11 @@ def _create_self_symbol(self, levels: List[np.ndarray]) -> np.ndarray:
     This is where the "I" emerges in Hofstadter's framework
     """
     # Concatenate and compress all levels into self-symbol
-    combined = np.mean(levels, axis=0)
+    combined = np.stack(levels).mean(axis=0)
     
-    # Add recursive structure (self-reference)
-    self_reference = np.outer(
+    # Add recursive structure (self-reference): column means x row means
+    self_reference = np.einsum(
+        'i,j->ij',
         combined.mean(axis=0),
         combined.mean(axis=1)
     )
@@ -146,7 +159,8 @@ def _top_down_influence(self, self_model: np.ndarray,
                        sensory: np.ndarray) -> np.ndarray:
     """Top-down influence from self-model to sensory level"""
     influence = self_model * 0.3 + sensory * 0.7
-    return influence / (np.linalg.norm(influence) + 1e-8)
+    influence *= 1.0 / max(np.linalg.norm(influence), 1e-8)
+    return influence
 ```
 
 # ============================================================================
@@ -155,6 +169,165 @@ def _top_down_influence(self, self_model: np.ndarray,
 
 # ============================================================================
 
+def _build_step_kernel(dim_of, **jit_options):
+“””
+Compile the fused Ouroboros step, updating W and Mw in place and writing
+the forward output and meta prediction into the given buffers.
+dim_of(x) gives the vector length: the generic kernel reads x.shape[0],
+the specialized ones return a constant so LLVM can unroll the loops
+“””
+
+```
+@njit(fastmath=True, **jit_options)
+def kernel(W, Mw, x, lr, output, meta_prediction):
+    """
+    Returns (new_output, improvement, weight_norm, meta_norm,
+    self_reference_strength)
+    """
+    dim = dim_of(x)
+    new_output = np.empty(dim, dtype=W.dtype)
+
+    # Standard forward pass and META prediction of the weight change
+    for i in range(dim):
+        acc = 0.0
+        meta_acc = 0.0
+        for j in range(dim):
+            acc += W[i, j] * x[j]
+            meta_acc += Mw[i, j] * x[j]
+        output[i] = acc
+        meta_prediction[i] = meta_acc
+
+    # OUROBOROS: rank-1 update from the predicted gradient. Row i of the
+    # update only touches row i of W, so the new output is fused in
+    for i in range(dim):
+        step = lr * meta_prediction[i]
+        acc = 0.0
+        for j in range(dim):
+            W[i, j] += step * x[j]
+            acc += W[i, j] * x[j]
+        new_output[i] = acc
+
+    old_sq = 0.0
+    new_sq = 0.0
+    pred_sum = 0.0
+    for i in range(dim):
+        old_sq += output[i] * output[i]
+        new_sq += new_output[i] * new_output[i]
+        pred_sum += meta_prediction[i]
+    improvement = math.sqrt(new_sq) - math.sqrt(old_sq)
+
+    # META-META: Learn to predict better gradients. The same pass gathers
+    # the raw moments for the norms and the weight/meta-weight correlation
+    meta_step = lr * (improvement - pred_sum / dim)
+    w_sum = 0.0
+    m_sum = 0.0
+    w_sq = 0.0
+    m_sq = 0.0
+    wm = 0.0
+    for i in range(dim):
+        for j in range(dim):
+            Mw[i, j] += meta_step * x[i] * x[j]
+            w = W[i, j]
+            m = Mw[i, j]
+            w_sum += w
+            m_sum += m
+            w_sq += w * w
+            m_sq += m * m
+            wm += w * m
+
+    # Pearson correlation of the flattened matrices from the raw moments
+    n = dim * dim
+    cov = wm - w_sum * m_sum / n
+    w_var = w_sq - w_sum * w_sum / n
+    m_var = m_sq - m_sum * m_sum / n
+
+    return (new_output, improvement,
+            math.sqrt(w_sq), math.sqrt(m_sq), cov / math.sqrt(w_var * m_var))
+
+return kernel
+```
+
+@njit
+def _vector_dim(x):
+“””Length of the input vector, the dim of the generic kernel“””
+
+```
+return x.shape[0]
+```
+
+# One fused Ouroboros step for inputs of any length
+_ouroboros_kernel = _build_step_kernel(_vector_dim, cache=True)
+
+def _ouroboros_step_blas(W, Mw, x, lr, output, meta_prediction):
+“””
+NumPy/BLAS counterpart of _ouroboros_kernel, used when numba is missing
+Both rank-1 updates go through BLAS ger, in place when the weights are
+Fortran-ordered (as OuroborosLearning keeps them) and copied back otherwise
+“””
+
+```
+from scipy.linalg.blas import get_blas_funcs
+ger = get_blas_funcs('ger', (W,))
+
+# Standard forward pass and META prediction of the weight change
+np.dot(W, x, out=output)
+np.dot(Mw, x, out=meta_prediction)
+
+# OUROBOROS: W += lr * meta_prediction ⊗ x. ger only overwrites a
+# Fortran-ordered a, so copy the result back for any other layout
+updated = ger(lr, meta_prediction, x, a=W, overwrite_a=1)
+if updated is not W:
+    W[...] = updated
+new_output = W @ x
+improvement = math.sqrt(new_output @ new_output) - math.sqrt(output @ output)
+
+# META-META: Mw += lr * meta_error * x ⊗ x
+meta_step = lr * (improvement - meta_prediction.mean())
+updated = ger(meta_step, x, x, a=Mw, overwrite_a=1)
+if updated is not Mw:
+    Mw[...] = updated
+
+# Norms and Pearson correlation from the raw moments of flat views
+w = W.ravel(order='K')
+m = Mw.ravel(order='K')
+n = w.size
+w_sum, m_sum = w.sum(), m.sum()
+w_sq, m_sq, wm = w @ w, m @ m, w @ m
+cov = wm - w_sum * m_sum / n
+w_var = w_sq - w_sum * w_sum / n
+m_var = m_sq - m_sum * m_sum / n
+
+return (new_output, improvement,
+        math.sqrt(w_sq), math.sqrt(m_sq), cov / math.sqrt(w_var * m_var))
+```
+
+# Compiled loops when numba is present, otherwise BLAS-backed NumPy
+_ouroboros_step = _ouroboros_kernel if NUMBA_AVAILABLE else _ouroboros_step_blas
+
+UNROLL_MAX_DIM = 32
+_STEP_KERNELS = {}
+
+def _make_step_kernel(dim: int):
+“””
+Build an Ouroboros step kernel with dim baked in as a compile-time
+constant, letting LLVM fully unroll the matvec and update loops.
+Falls back to the generic step when numba is unavailable or dim is large
+“””
+
+```
+if not NUMBA_AVAILABLE or dim > UNROLL_MAX_DIM:
+    return _ouroboros_step
+
+if dim not in _STEP_KERNELS:
+    @njit
+    def fixed_dim(x):
+        return dim
+    
+    _STEP_KERNELS[dim] = _build_step_kernel(fixed_dim)
+
+return _STEP_KERNELS[dim]
+```
+
 class OuroborosLearning:
 “””
 Self-referential learning where the system learns to predict
@@ -162,11 +335,60 @@ its own learning dynamics (eating its own tail)
 “””
 
 ```
-def __init__(self, dim: int = 10):
+# One record per step for the scalar quantities of the loop
+HISTORY_DTYPE = np.dtype([('improvement', 'f8'),
+                          ('weight_norm', 'f8'),
+                          ('meta_norm', 'f8')])
+
+def __init__(self, dim: int = 10, max_steps: int = 1000,
+             seed: Optional[int] = None):
     self.dim = dim
-    self.weights = np.random.randn(dim, dim) * 0.1
-    self.meta_weights = np.random.randn(dim, dim) * 0.1
-    self.history = []
+    # One local Generator draws the initial weights and the demo inputs,
+    # so a seed makes the whole run reproducible
+    self._rng = np.random.default_rng(seed)
+    
+    # float32 halves memory traffic and doubles SIMD lanes; Fortran
+    # order lets BLAS ger update the weights in place
+    self.weights = np.asfortranarray(
+        self._rng.standard_normal((dim, dim), dtype=np.float32) * 0.1)
+    self.meta_weights = np.asfortranarray(
+        self._rng.standard_normal((dim, dim), dtype=np.float32) * 0.1)
+    self._step = _make_step_kernel(dim)
+    
+    # Preallocated per-step history: a record array for the scalars and
+    # row-per-step arrays for the vectors, grown geometrically if more
+    # than max_steps steps are taken
+    self.n_steps = 0
+    self._records = np.empty(max_steps, dtype=self.HISTORY_DTYPE)
+    self._outputs = np.empty((max_steps, dim), dtype=np.float32)
+    self._meta_predictions = np.empty((max_steps, dim), dtype=np.float32)
+    
+    # Input operand of the rank-1 updates, reused every step so float64
+    # inputs are cast in place instead of into a fresh array
+    self._x = np.empty(dim, dtype=np.float32)
+
+@property
+def history(self) -> np.ndarray:
+    """Recorded steps so far; history['improvement'] etc. are columns"""
+    return self._records[:self.n_steps]
+
+@property
+def outputs(self) -> np.ndarray:
+    """Forward output of each recorded step, one row per step"""
+    return self._outputs[:self.n_steps]
+
+@property
+def meta_predictions(self) -> np.ndarray:
+    """Meta prediction of each recorded step, one row per step"""
+    return self._meta_predictions[:self.n_steps]
+
+def _grow_history(self):
+    """Double the capacity of the history buffers"""
+    for name in ('_records', '_outputs', '_meta_predictions'):
+        buf = getattr(self, name)
+        grown = np.empty((2 * len(buf),) + buf.shape[1:], dtype=buf.dtype)
+        grown[:len(buf)] = buf
+        setattr(self, name, grown)
     
 def ouroboros_step(self, input_data: np.ndarray, 
                    learning_rate: float = 0.01) -> Dict:
@@ -178,61 +400,126 @@ def ouroboros_step(self, input_data: np.ndarray,
     4. Learn to predict better weight changes
     """
     
-    # Standard forward pass
-    output = self.weights @ input_data
-    
-    # META LEVEL: Predict how weights should change
-    weight_gradient_pred = self.meta_weights @ input_data
-    
-    # OUROBOROS: Use predicted gradient to update weights
-    self.weights += learning_rate * weight_gradient_pred.reshape(self.dim, 1) @ input_data.reshape(1, self.dim)
-    
-    # New output after weight update
-    new_output = self.weights @ input_data
-    improvement = np.linalg.norm(new_output) - np.linalg.norm(output)
-    
-    # META-META: Learn to predict better gradients
-    meta_error = improvement - np.mean(weight_gradient_pred)
-    self.meta_weights += learning_rate * meta_error * np.outer(input_data, input_data)
+    if self.n_steps == len(self._records):
+        self._grow_history()
+    step = self.n_steps
+    
+    # Forward pass, weight update and meta update run in one compiled
+    # kernel, which writes output and meta prediction into the history
+    x = self._x
+    x[:] = input_data
+    (new_output, improvement, weight_norm, meta_norm,
+     self_reference_strength) = self._step(
+        self.weights, self.meta_weights, x, learning_rate,
+        self._outputs[step], self._meta_predictions[step]
+    )
     
     # Track the loop
-    self.history.append({
-        'output': output,
-        'meta_prediction': weight_gradient_pred,
-        'improvement': improvement,
-        'weight_norm': np.linalg.norm(self.weights),
-        'meta_norm': np.linalg.norm(self.meta_weights)
-    })
+    self._records[step] = (improvement, weight_norm, meta_norm)
+    self.n_steps += 1
     
     return {
         'output': new_output,
         'improvement': improvement,
-        'self_reference_strength': np.corrcoef(
-            self.weights.flatten(),
-            self.meta_weights.flatten()
-        )[0, 1]
+        'self_reference_strength': self_reference_strength
     }
 
 def demonstrate_self_improvement(self, n_iterations: int = 100):
-    """Show how Ouroboros learning improves through self-reference"""
+    """
+    Show how Ouroboros learning improves through self-reference
+    Inputs come from the learner's Generator; seed the constructor for
+    a reproducible run
+    """
+    
+    # Random unit-norm inputs, drawn and normalized in one pass
+    X = self._rng.standard_normal((n_iterations, self.dim), dtype=np.float32)
+    X /= np.linalg.norm(X, axis=1, keepdims=True)
     
     for i in range(n_iterations):
-        # Random input
-        x = np.random.randn(self.dim)
-        x = x / np.linalg.norm(x)
-        
         # Ouroboros step
-        result = self.ouroboros_step(x, learning_rate=0.01)
+        result = self.ouroboros_step(X[i], learning_rate=0.01)
     
     return self.history
 ```
 
+@njit(parallel=True, cache=True)
+def run_sweep(n_runs: int, n_iter: int, dim: int = 10,
+              learning_rate: float = 0.01):
+“””
+Run many independent Ouroboros learners in parallel
+Only the outer loop over runs is parallel; the steps inside each run
+depend on the previous weights and stay sequential
+Returns (improvement, weight_norm, meta_norm), each (n_runs, n_iter)
+“””
+
+```
+improvement = np.empty((n_runs, n_iter))
+weight_norm = np.empty((n_runs, n_iter))
+meta_norm = np.empty((n_runs, n_iter))
+
+for r in prange(n_runs):
+    # Each run owns its weights and scratch buffers
+    W = (np.random.randn(dim, dim) * 0.1).astype(np.float32)
+    Mw = (np.random.randn(dim, dim) * 0.1).astype(np.float32)
+    output = np.empty(dim, dtype=np.float32)
+    meta_prediction = np.empty(dim, dtype=np.float32)
+    
+    for i in range(n_iter):
+        x = np.random.randn(dim).astype(np.float32)
+        x /= np.sqrt(np.sum(x * x))
+        _, imp, w_norm, m_norm, _ = _ouroboros_kernel(
+            W, Mw, x, learning_rate, output, meta_prediction
+        )
+        improvement[r, i] = imp
+        weight_norm[r, i] = w_norm
+        meta_norm[r, i] = m_norm
+
+return improvement, weight_norm, meta_norm
+```
+
 # ============================================================================
 
 # GÖDEL-STYLE SELF-REFERENCE
 
 # ============================================================================
 
+@njit(cache=True)
+def _godel_encode(vals, primes, mod):
+“””
+Product of primes[i] ** vals[i] modulo a prime mod, by square-and-multiply
+Negative exponents use the Fermat inverse primes[i] ** (mod - 2)
+“””
+
+```
+godel_number = 1
+for i in range(min(vals.shape[0], primes.shape[0])):
+    base = primes[i] % mod
+    exp = vals[i]
+    if exp < 0:
+        # Invert the base first, then raise to -exp
+        inv = 1
+        e = mod - 2
+        b = base
+        while e > 0:
+            if e & 1:
+                inv = (inv * b) % mod
+            b = (b * b) % mod
+            e >>= 1
+        base = inv
+        exp = -exp
+    
+    # All intermediates stay below mod**2, well inside int64
+    term = 1
+    while exp > 0:
+        if exp & 1:
+            term = (term * base) % mod
+        base = (base * base) % mod
+        exp >>= 1
+    godel_number = (godel_number * term) % mod
+
+return godel_number
+```
+
 class GodelianAttention:
 “””
 Implements Gödel-style self-reference where attention patterns
@@ -240,28 +527,43 @@ encode statements about themselves (incompleteness emerges)
 “””
 
 ```
+# Gödel numbers are kept modulo this prime to stay manageable. A prime
+# modulus is coprime to every base; with 10**6 the 2**k * 5**k factors
+# would send every code to 0
+MODULUS = 1_000_003
+
+# Prime bases for the simplified Gödel numbering
+_PRIMES = np.array([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53],
+                   dtype=np.int64)
+_LOG_PRIMES = np.log(_PRIMES.astype(np.float64))
+
 def __init__(self, size: int = 16):
     self.size = size
     self.encoding = {}
     self.statements = []
     
+def _godel_exponents(self, attention_pattern: np.ndarray) -> np.ndarray:
+    """Discretized pattern values used as the prime exponents"""
+    # Flatten and discretize
+    flat = attention_pattern.ravel()[:len(self._PRIMES)]
+    return np.round(flat * 100).astype(np.int64) + 100  # Make positive
+
 def encode_attention_as_number(self, attention_pattern: np.ndarray) -> int:
     """
     Gödel numbering for attention patterns
     Each pattern gets a unique number that can be reasoned about
     """
-    # Flatten and discretize
-    flat = attention_pattern.flatten()
-    discretized = np.round(flat * 100).astype(int) + 100  # Make positive
-    
-    # Prime encoding (simplified Gödel numbering)
-    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53]
-    
-    godel_number = 1
-    for i, val in enumerate(discretized[:len(primes)]):
-        godel_number *= primes[i] ** val
-    
-    return godel_number % 1000000  # Keep manageable
+    # Prime encoding (simplified Gödel numbering), compiled modpow loop
+    vals = self._godel_exponents(attention_pattern)
+    return int(_godel_encode(vals, self._PRIMES, self.MODULUS))
+
+def encode_attention_as_number_log(self, attention_pattern: np.ndarray) -> float:
+    """
+    Logarithm of the unreduced Gödel number, sum(vals * log(primes))
+    Keeps the magnitude ordering that the modulus scrambles
+    """
+    vals = self._godel_exponents(attention_pattern)
+    return float(vals @ self._LOG_PRIMES[:len(vals)])
 
 def create_self_referential_statement(self) -> Dict:
     """
@@ -274,15 +576,19 @@ def create_self_referential_statement(self) -> Dict:
     
     # Encode it
     code = self.encode_attention_as_number(pattern)
+    original = pattern.copy()
     
     # Modify pattern to include its own code
-    pattern[0, 0] = code / 1000000  # Normalize
+    pattern[0, 0] = code / self.MODULUS  # Normalize
     
     # Re-encode (now it contains information about itself)
     new_code = self.encode_attention_as_number(pattern)
     
-    # This pattern now makes a statement about itself!
-    self_reference_strength = abs(code - new_code) / max(code, new_code)
+    # This pattern now makes a statement about itself! Compare the
+    # Gödel magnitudes in log domain, where the modulus does not interfere
+    log_code = self.encode_attention_as_number_log(original)
+    log_new = self.encode_attention_as_number_log(pattern)
+    self_reference_strength = abs(log_code - log_new) / max(log_code, log_new)
     
     return {
         'pattern': pattern,
@@ -302,6 +608,10 @@ def visualize_strange_loop():
 “”“Visualize the strange loop architecture”””
 
 ```
+# Plotting is optional, so matplotlib is only loaded when drawing
+import matplotlib.pyplot as plt
+from matplotlib.patches import FancyBboxPatch, Circle, FancyArrow
+
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
 # Left: Traditional hierarchy
@@ -334,10 +644,19 @@ ax2.set_ylim(-2, 2)
 # Create circular arrangement
 angles = np.linspace(0, 2*np.pi, 5)[:-1]
 radius = 1.2
+xs = radius * np.cos(angles)
+ys = radius * np.sin(angles)
 
-for i, (level, color, angle) in enumerate(zip(levels, colors, angles)):
-    x = radius * np.cos(angle)
-    y = radius * np.sin(angle)
+# Arrows showing the loop run from each node to the next one round;
+# (dxs, dys) offset each arrow by one node radius along its direction
+gap_x = np.roll(xs, -1) - xs
+gap_y = np.roll(ys, -1) - ys
+norms = np.hypot(gap_x, gap_y)
+dxs = gap_x / norms * 0.35
+dys = gap_y / norms * 0.35
+
+for i, (level, color) in enumerate(zip(levels, colors)):
+    x, y = xs[i], ys[i]
     
     circle = Circle((x, y), 0.35, facecolor=color, 
                    edgecolor='black', linewidth=2)
@@ -346,18 +665,9 @@ for i, (level, color, angle) in enumerate(zip(levels, colors, angles)):
             fontsize=10, fontweight='bold')
     
     # Add arrows showing the loop
-    next_angle = angles[(i+1) % 4]
-    next_x = radius * np.cos(next_angle)
-    next_y = radius * np.sin(next_angle)
-    
-    # Calculate arrow position
-    dx = next_x - x
-    dy = next_y - y
-    norm = np.sqrt(dx**2 + dy**2)
-    dx, dy = dx/norm * 0.35, dy/norm * 0.35
-    
+    dx, dy = dxs[i], dys[i]
     ax2.arrow(x + dx, y + dy,
-             (next_x - x - 2*dx)*0.8, (next_y - y - 2*dy)*0.8,
+             (gap_x[i] - 2*dx)*0.8, (gap_y[i] - 2*dy)*0.8,
              head_width=0.1, head_length=0.1, fc='black', alpha=0.6)
 
 # Add central "I" symbol
@@ -372,16 +682,18 @@ plt.tight_layout()
 plt.show()
 ```
 
-def plot_ouroboros_dynamics(history: List[Dict]):
+def plot_ouroboros_dynamics(history: np.ndarray):
 “”“Visualize Ouroboros learning dynamics”””
 
 ```
+import matplotlib.pyplot as plt
+
 fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
-# Extract time series
-improvements = [h['improvement'] for h in history]
-weight_norms = [h['weight_norm'] for h in history]
-meta_norms = [h['meta_norm'] for h in history]
+# Record fields are the time series directly
+improvements = history['improvement']
+weight_norms = history['weight_norm']
+meta_norms = history['meta_norm']
 
 # Improvement over time
 ax1 = axes[0, 0]
@@ -403,7 +715,7 @@ ax2.grid(True, alpha=0.3)
 
 # Phase space
 ax3 = axes[1, 0]
-ax3.scatter(weight_norms, meta_norms, c=range(len(weight_norms)),
+ax3.scatter(weight_norms, meta_norms, c=np.arange(len(weight_norms)),
            cmap='viridis', alpha=0.6)
 ax3.set_title('Phase Space (Weight vs Meta-Weight)')
 ax3.set_xlabel('Weight Norm')
@@ -477,7 +789,7 @@ ouroboros = OuroborosLearning(dim=10)
 print("Running self-referential learning...")
 history = ouroboros.demonstrate_self_improvement(n_iterations=100)
 
-final_improvement = history[-1]['improvement']
+final_improvement = history['improvement'][-1]
 print(f"Final improvement: {final_improvement:.4f}")
 
 # Check for self-reference
@@ -10,6 +10,7 @@ Usage: python3 make_all.py
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def print_header(text):
@@ -49,15 +50,19 @@ def create_directory_structure():
         '.github/workflows'
     ]
     
-    for i, dir_path in enumerate(directories):
+    def make_dir(dir_path):
         Path(dir_path).mkdir(parents=True, exist_ok=True)
-        print_progress(i+1, len(directories), f"Created {dir_path}")
+        return dir_path
+    
+    # mkdir releases the GIL, so the syscalls overlap across threads
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for i, dir_path in enumerate(ex.map(make_dir, directories)):
+            print_progress(i+1, len(directories), f"Created {dir_path}")
     
     print("✅ Directory structure complete!")
 
-def create_readme():
-    """Create the main README with honest framing"""
-    print_header("Creating README")
+def readme_content():
+    """Main README content with honest framing"""
     
     readme_content = """# Multi-Geometric Attention Theory (MGAT)
 *From Empirical Patterns to Geometric Hypothesis*
@@ -172,14 +177,10 @@ Hillary Danan - hillarydanan@gmail.com
 *"The 9.7% bottleneck is empirical fact. The geometric explanation is our hypothesis."*
 """
     
-    with open('README.md', 'w') as f:
-        f.write(readme_content)
-    
-    print("✅ README created with honest framing!")
+    return readme_content
 
-def create_requirements():
-    """Create requirements.txt"""
-    print_header("Creating Requirements File")
+def requirements_content():
+    """requirements.txt content"""
     
     requirements = """# Core dependencies
 numpy>=1.20.0
@@ -200,14 +201,10 @@ sphinx>=4.0.0
 sphinx-rtd-theme>=0.5.0
 """
     
-    with open('requirements.txt', 'w') as f:
-        f.write(requirements)
-    
-    print("✅ Requirements file created!")
+    return requirements
 
-def create_citation_file():
-    """Create CITATION.cff for GitHub"""
-    print_header("Creating Citation File")
+def citation_content():
+    """CITATION.cff content for GitHub"""
     
     citation = """cff-version: 1.2.0
 title: Multi-Geometric Attention Theory
@@ -231,14 +228,10 @@ version: 1.0.0
 date-released: '2025-08-18'
 """
     
-    with open('CITATION.cff', 'w') as f:
-        f.write(citation)
-    
-    print("✅ Citation file created!")
+    return citation
 
-def create_license():
-    """Create MIT license"""
-    print_header("Creating License")
+def license_content():
+    """MIT license text"""
     
     license_text = """MIT License
 
@@ -263,14 +256,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
     
-    with open('LICENSE', 'w') as f:
-        f.write(license_text)
-    
-    print("✅ License created!")
+    return license_text
 
-def create_gitignore():
-    """Create .gitignore"""
-    print_header("Creating .gitignore")
+def gitignore_content():
+    """.gitignore content"""
     
     gitignore = """# Python
 __pycache__/
@@ -304,14 +293,10 @@ logs/
 docs/_build/
 """
     
-    with open('.gitignore', 'w') as f:
-        f.write(gitignore)
-    
-    print("✅ .gitignore created!")
+    return gitignore
 
-def create_test_script():
-    """Create a test script to verify everything works"""
-    print_header("Creating Test Script")
+def test_script_content():
+    """Test script that verifies everything works"""
     
     test_script = """#!/usr/bin/env python3
 '''Test that MGAT framework is working correctly'''
@@ -372,26 +357,48 @@ if __name__ == "__main__":
         print("⚠️ Some tests failed. Check implementation.")
 """
     
-    with open('test_mgat.py', 'w') as f:
-        f.write(test_script)
+    return test_script
+
+def write_project_files():
+    """Write all generated project files in one batch"""
+    print_header("Writing Project Files")
+    
+    files = {
+        'README.md': readme_content(),
+        'requirements.txt': requirements_content(),
+        'CITATION.cff': citation_content(),
+        'LICENSE': license_content(),
+        '.gitignore': gitignore_content(),
+        'test_mgat.py': test_script_content()
+    }
+    
+    def write_file(item):
+        path, content = item
+        Path(path).write_text(content)
+        return path
+    
+    with ThreadPoolExecutor() as ex:
+        for i, path in enumerate(ex.map(write_file, files.items())):
+            print_progress(i+1, len(files), f"Wrote {path}")
     
     os.chmod('test_mgat.py', 0o755)
-    print("✅ Test script created!")
+    print("✅ README, requirements, citation, license, .gitignore "
+          "and test script created!")
 
 def setup_git():
     """Initialize git repository"""
     print_header("Setting up Git")
     
     try:
-        # Check if git is already initialized
-        if not os.path.exists('.git'):
-            subprocess.run(['git', 'init'], check=True)
-            print("✅ Git repository initialized")
-        else:
-            print("✅ Git already initialized")
+        # Initialize if needed and stage all files in one shell invocation
+        initialized = os.path.exists('.git')
+        command = 'git add .' if initialized else 'git init && git add .'
+        subprocess.run(['sh', '-c', command], check=True)
         
-        # Add all files
-        subprocess.run(['git', 'add', '.'], check=True)
+        if initialized:
+            print("✅ Git already initialized")
+        else:
+            print("✅ Git repository initialized")
         print("✅ Files staged for commit")
         
         return True
@@ -452,38 +459,19 @@ def main():
     print("  Complete Setup Script")
     print("="*60)
     
-    total_steps = 8
+    total_steps = 3
     
     # Step 1: Create directories
     print_progress(1, total_steps, "Creating directories...")
     create_directory_structure()
     
-    # Step 2: Create README
-    print_progress(2, total_steps, "Creating README...")
-    create_readme()
-    
-    # Step 3: Create requirements
-    print_progress(3, total_steps, "Creating requirements...")
-    create_requirements()
-    
-    # Step 4: Create citation
-    print_progress(4, total_steps, "Creating citation file...")
-    create_citation_file()
-    
-    # Step 5: Create license
-    print_progress(5, total_steps, "Creating license...")
-    create_license()
-    
-    # Step 6: Create gitignore
-    print_progress(6, total_steps, "Creating .gitignore...")
-    create_gitignore()
-    
-    # Step 7: Create test script
-    print_progress(7, total_steps, "Creating test script...")
-    create_test_script()
+    # Step 2: Write README, requirements, citation, license,
+    # .gitignore and test script
+    print_progress(2, total_steps, "Writing project files...")
+    write_project_files()
     
-    # Step 8: Setup git
-    print_progress(8, total_steps, "Setting up git...")
+    # Step 3: Setup git
+    print_progress(3, total_steps, "Setting up git...")
     setup_git()
     
     # Print final instructions
@@ -8,16 +8,63 @@ Author: Hillary Danan
 Date: August 2025
 """
 
+import re
 import numpy as np
-import torch
-import torch.nn as nn
-from typing import Dict, Tuple, Optional, List
-from scipy import stats
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Tuple, Optional, List
+from scipy.special import chdtrc
+
+if TYPE_CHECKING:  # torch is heavy to import and only named in annotations
+    import torch
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; marker scans fall back to str/np.char
+    NUMBA_AVAILABLE = False
+    prange = range
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # ============================================
 # PART 1: EMPIRICAL FINDINGS (What we've proven)
 # ============================================
 
+@njit(cache=True)
+def _score_markers(text, lo, hi, marker_buf, marker_starts, marker_lens,
+                   phase_idx, scores):
+    """
+    Add one point to scores[phase] for each marker found in text[lo:hi].
+    Text and markers are UTF-8 bytes, so byte matches are string matches.
+    """
+    for m in range(marker_starts.shape[0]):
+        start = marker_starts[m]
+        length = marker_lens[m]
+        for pos in range(lo, hi - length + 1):
+            j = 0
+            while j < length and text[pos + j] == marker_buf[start + j]:
+                j += 1
+            if j == length:
+                scores[phase_idx[m]] += 1
+                break
+
+
+@njit(parallel=True, cache=True)
+def _score_batch(buf, offsets, marker_buf, marker_starts, marker_lens,
+                 phase_idx, n_phases):
+    """Score texts packed back to back in buf, in parallel across texts."""
+    n_texts = offsets.shape[0] - 1
+    scores = np.zeros((n_texts, n_phases), dtype=np.int64)
+    for t in prange(n_texts):
+        _score_markers(buf, offsets[t], offsets[t + 1], marker_buf,
+                       marker_starts, marker_lens, phase_idx, scores[t])
+    return scores
+
+
 class EmpiricalPhaseAnalyzer:
     """
     Analyzes conversational phases based on PROVEN patterns from ouroboros-learning.
@@ -30,6 +77,7 @@ class EmpiricalPhaseAnalyzer:
         'consumption': 0.299,      # 29.9%
         'integration': 0.386       # 38.6%
     }
+    _EXPECTED_PROBS = np.array(list(EMPIRICAL_DISTRIBUTION.values()), dtype=np.float64)
     
     def __init__(self):
         self.phase_markers = {
@@ -38,6 +86,36 @@ class EmpiricalPhaseAnalyzer:
             'consumption': ['analyze', 'break down', 'examine', 'dissect'],
             'integration': ['connect', 'combine', 'synthesize', 'merge']
         }
+        
+        # Flattened marker table for batch classification
+        self.phases = list(self.phase_markers)
+        self._phase_names = tuple(self.phases)
+        self._phase_to_idx = {phase: i for i, phase in enumerate(self.phases)}
+        self._distribution_idx = np.array(
+            [self._phase_to_idx[phase] for phase in self.EMPIRICAL_DISTRIBUTION])
+        self.markers = [marker for markers in self.phase_markers.values()
+                        for marker in markers]
+        self.marker_to_phase_idx = np.array(
+            [i for i, markers in enumerate(self.phase_markers.values())
+             for _ in markers])
+        
+        # Markers packed as UTF-8 bytes for the compiled scans
+        encoded = [marker.encode('utf-8') for marker in self.markers]
+        self._marker_lens = np.array([len(m) for m in encoded], dtype=np.int64)
+        self._marker_starts = np.concatenate(
+            ([0], np.cumsum(self._marker_lens)[:-1])).astype(np.int64)
+        self._marker_buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        
+        # One regex scan over all markers for the pure-Python path. The
+        # lookahead reports overlapping hits too; a marker is only missed
+        # where another marker that it prefixes matches at the same spot
+        self._marker_pattern = re.compile(
+            '(?=(' + '|'.join(map(re.escape, self.markers)) + '))')
+        self._marker_phase_idx = dict(zip(self.markers,
+                                          self.marker_to_phase_idx.tolist()))
+        
+        # Templated LLM output repeats itself; memoize per analyzer
+        self.classify_phase = lru_cache(maxsize=4096)(self.classify_phase)
     
     def classify_phase(self, text: str) -> str:
         """
@@ -45,43 +123,84 @@ class EmpiricalPhaseAnalyzer:
         This method is based on ACTUAL patterns found in GPT-3.5.
         """
         text_lower = text.lower()
-        scores = {}
+        scores = np.zeros(len(self._phase_names), dtype=np.int32)
+        
+        if NUMBA_AVAILABLE:
+            text_bytes = np.frombuffer(text_lower.encode('utf-8'), dtype=np.uint8)
+            _score_markers(text_bytes, 0, len(text_bytes), self._marker_buf,
+                           self._marker_starts, self._marker_lens,
+                           self.marker_to_phase_idx, scores)
+        else:
+            # Distinct markers present, as with a membership test per marker
+            for marker in set(self._marker_pattern.findall(text_lower)):
+                scores[self._marker_phase_idx[marker]] += 1
         
-        for phase, markers in self.phase_markers.items():
-            score = sum(1 for marker in markers if marker in text_lower)
-            scores[phase] = score
+        # First phase wins ties; default to integration (most common)
+        idx = int(scores.argmax())
+        return self._phase_names[idx] if scores[idx] > 0 else 'integration'
+    
+    def classify_batch(self, texts: List[str], return_ids: bool = False) -> np.ndarray:
+        """
+        Classify many texts at once, same rules as classify_phase.
+        Texts are scanned in parallel by a compiled kernel, or each marker
+        is scanned across all texts in a single NumPy pass without numba.
+        With return_ids, gives int8 indices into self.phases instead of names.
+        """
+        if NUMBA_AVAILABLE:
+            # Pack all lowered texts into one byte buffer with offsets
+            encoded = [text.lower().encode('utf-8') for text in texts]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(e) for e in encoded], out=offsets[1:])
+            buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            scores = _score_batch(buf, offsets, self._marker_buf,
+                                  self._marker_starts, self._marker_lens,
+                                  self.marker_to_phase_idx, len(self.phases))
+        else:
+            lowered = np.char.lower(np.asarray(texts, dtype=str))
+            scores = np.zeros((len(lowered), len(self.phases)), dtype=np.int64)
+            for marker, phase_idx in zip(self.markers, self.marker_to_phase_idx):
+                scores[:, phase_idx] += np.char.find(lowered, marker) >= 0
         
-        # Default to integration (most common)
-        if max(scores.values()) == 0:
-            return 'integration'
+        # Ties go to the first phase, as with max(); no markers -> integration
+        labels = scores.argmax(axis=1)
+        labels[scores.max(axis=1, initial=0) == 0] = self._phase_to_idx['integration']
         
-        return max(scores, key=scores.get)
+        if return_ids:
+            return labels.astype(np.int8)
+        return np.array(self.phases)[labels]
     
     def validate_distribution(self, observed_phases: List[str]) -> Dict:
         """
         Statistical validation against empirical distribution.
+        Accepts phase names or the integer ids from classify_batch.
         Returns chi-square test results.
         """
-        # Count observed frequencies
-        phase_counts = {phase: observed_phases.count(phase) 
-                       for phase in self.EMPIRICAL_DISTRIBUTION.keys()}
+        # Count observed frequencies in a single pass, in the order of
+        # EMPIRICAL_DISTRIBUTION
+        if isinstance(observed_phases, np.ndarray) and observed_phases.dtype.kind in 'iu':
+            id_counts = np.bincount(observed_phases, minlength=len(self.phases))
+            observed_freq = id_counts[self._distribution_idx].astype(np.float64)
+        else:
+            counts = Counter(observed_phases)
+            observed_freq = np.fromiter(
+                (counts[phase] for phase in self.EMPIRICAL_DISTRIBUTION),
+                dtype=np.float64, count=len(self.EMPIRICAL_DISTRIBUTION))
         
         # Expected frequencies
         n = len(observed_phases)
-        expected = {phase: n * freq 
-                   for phase, freq in self.EMPIRICAL_DISTRIBUTION.items()}
+        expected_freq = n * self._EXPECTED_PROBS
         
-        # Chi-square test
-        observed_freq = list(phase_counts.values())
-        expected_freq = list(expected.values())
-        chi2, p_value = stats.chisquare(observed_freq, expected_freq)
+        # Chi-square test, k - 1 degrees of freedom
+        chi2 = float(((observed_freq - expected_freq) ** 2 / expected_freq).sum())
+        p_value = float(chdtrc(len(observed_freq) - 1, chi2))
         
         return {
             'chi_square': chi2,
             'p_value': p_value,
             'significant': p_value < 0.05,
-            'observed': phase_counts,
-            'expected': expected
+            'observed': dict(zip(self.EMPIRICAL_DISTRIBUTION,
+                                 observed_freq.astype(int).tolist())),
+            'expected': dict(zip(self.EMPIRICAL_DISTRIBUTION, expected_freq.tolist()))
         }
 
 
@@ -123,7 +242,7 @@ class TheoreticalGeometricMapper:
         
         return self.PHASE_TO_GEOMETRY.get(phase, 'unknown')
     
-    def analyze_attention_geometry(self, attention_weights: torch.Tensor) -> Dict:
+    def analyze_attention_geometry(self, attention_weights: 'torch.Tensor') -> Dict:
         """
         EXPERIMENTAL: Attempt to identify geometric patterns in attention.
         This method is speculative and needs validation.
@@ -142,6 +261,74 @@ class TheoreticalGeometricMapper:
 # PART 3: TESTABLE PREDICTIONS
 # ============================================
 
+def _freeze(obj):
+    """Read-only view of nested dict/list constants, built once at import"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+def _thaw(obj):
+    """Fresh mutable dict/list copy of a _freeze'd constant, for callers"""
+    if isinstance(obj, MappingProxyType):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(value) for value in obj]
+    return obj
+
+
+_PREDICTIONS = _freeze([
+    {
+        'id': 1,
+        'prediction': 'Attention heads will cluster into 4 geometric types',
+        'test': 'Analyze attention connectivity patterns in transformers',
+        'expected': 'Clustering coefficient matches geometric predictions',
+        'status': 'untested'
+    },
+    {
+        'id': 2,
+        'prediction': '9.7% of attention heads show pentagonal (5-connectivity) patterns',
+        'test': 'Count attention heads with 5-way balanced connections',
+        'expected': '9.7% ± 2% show pentagonal structure',
+        'status': 'untested'
+    },
+    {
+        'id': 3,
+        'prediction': 'Other LLMs show similar 9.7% transformation bottleneck',
+        'test': 'Replicate ouroboros analysis on GPT-4, Claude, etc.',
+        'expected': 'Similar phase distributions',
+        'status': 'untested'
+    },
+    {
+        'id': 4,
+        'prediction': 'Geometric diversity correlates with model performance',
+        'test': 'Compare geometric entropy to benchmark scores',
+        'expected': 'Higher diversity → better performance',
+        'status': 'untested'
+    }
+])
+
+_VALIDATION_PROTOCOL = _freeze({
+    'phase_1': {
+        'goal': 'Replicate phase patterns in other models',
+        'method': 'Apply ouroboros analysis to multiple LLMs',
+        'success_criteria': 'p < 0.05 for non-uniform distribution'
+    },
+    'phase_2': {
+        'goal': 'Identify geometric patterns in attention',
+        'method': 'Analyze attention head connectivity',
+        'success_criteria': 'Statistically significant clustering'
+    },
+    'phase_3': {
+        'goal': 'Validate phase-geometry mapping',
+        'method': 'Correlate phases with attention patterns',
+        'success_criteria': 'Correlation > 0.7'
+    }
+})
+
+
 class TestablePredictions:
     """
     Generates testable predictions to validate or refute the geometric hypothesis.
@@ -151,66 +338,41 @@ class TestablePredictions:
     def get_predictions() -> List[Dict]:
         """
         List of specific, testable predictions.
+        Returns a fresh copy of the read-only module constant.
         """
-        return [
-            {
-                'id': 1,
-                'prediction': 'Attention heads will cluster into 4 geometric types',
-                'test': 'Analyze attention connectivity patterns in transformers',
-                'expected': 'Clustering coefficient matches geometric predictions',
-                'status': 'untested'
-            },
-            {
-                'id': 2,
-                'prediction': '9.7% of attention heads show pentagonal (5-connectivity) patterns',
-                'test': 'Count attention heads with 5-way balanced connections',
-                'expected': '9.7% ± 2% show pentagonal structure',
-                'status': 'untested'
-            },
-            {
-                'id': 3,
-                'prediction': 'Other LLMs show similar 9.7% transformation bottleneck',
-                'test': 'Replicate ouroboros analysis on GPT-4, Claude, etc.',
-                'expected': 'Similar phase distributions',
-                'status': 'untested'
-            },
-            {
-                'id': 4,
-                'prediction': 'Geometric diversity correlates with model performance',
-                'test': 'Compare geometric entropy to benchmark scores',
-                'expected': 'Higher diversity → better performance',
-                'status': 'untested'
-            }
-        ]
+        return _thaw(_PREDICTIONS)
     
     @staticmethod
     def validation_protocol() -> Dict:
         """
         Protocol for validating the geometric hypothesis.
         """
-        return {
-            'phase_1': {
-                'goal': 'Replicate phase patterns in other models',
-                'method': 'Apply ouroboros analysis to multiple LLMs',
-                'success_criteria': 'p < 0.05 for non-uniform distribution'
-            },
-            'phase_2': {
-                'goal': 'Identify geometric patterns in attention',
-                'method': 'Analyze attention head connectivity',
-                'success_criteria': 'Statistically significant clustering'
-            },
-            'phase_3': {
-                'goal': 'Validate phase-geometry mapping',
-                'method': 'Correlate phases with attention patterns',
-                'success_criteria': 'Correlation > 0.7'
-            }
-        }
+        return _thaw(_VALIDATION_PROTOCOL)
 
 
 # ============================================
 # PART 4: INTEGRATED FRAMEWORK
 # ============================================
 
+_STATUS = _freeze({
+    'proven': {
+        '9.7% bottleneck': 'Confirmed in GPT-3.5',
+        'phase_patterns': 'Statistically significant',
+        'reproducibility': 'Code and data available'
+    },
+    'hypothesized': {
+        'geometric_mapping': 'Theoretical interpretation',
+        'attention_patterns': 'Needs empirical validation',
+        'universality': 'Needs cross-model testing'
+    },
+    'in_progress': {
+        'attention_analysis': 'Developing methods',
+        'cross_model_validation': 'Collecting data',
+        'neurips_submission': 'Preparing paper'
+    }
+})
+
+
 class MGATFramework:
     """
     Integrated framework combining empirical findings with theoretical hypothesis.
@@ -250,23 +412,7 @@ class MGATFramework:
         """
         Current status of the research.
         """
-        return {
-            'proven': {
-                '9.7% bottleneck': 'Confirmed in GPT-3.5',
-                'phase_patterns': 'Statistically significant',
-                'reproducibility': 'Code and data available'
-            },
-            'hypothesized': {
-                'geometric_mapping': 'Theoretical interpretation',
-                'attention_patterns': 'Needs empirical validation',
-                'universality': 'Needs cross-model testing'
-            },
-            'in_progress': {
-                'attention_analysis': 'Developing methods',
-                'cross_model_validation': 'Collecting data',
-                'neurips_submission': 'Preparing paper'
-            }
-        }
+        return _thaw(_STATUS)
 
 
 # ============================================
@@ -8,21 +8,146 @@ Author: Hillary Danan
 Date: August 2025
 """
 
+import json
+import sys
 import torch
 import numpy as np
-from typing import Dict, List, Tuple
-import matplotlib.pyplot as plt
-from scipy import stats
+from typing import Dict, List, NamedTuple, Tuple
 from collections import defaultdict
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the simulations run as plain NumPy
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Attention-head geometries in index order; per-geometry arrays below
+# and in the results are aligned to this order
+_GEOM_NAMES = ('square', 'triangular', 'hexagonal', 'pentagonal')
+_GEOM_INDEX = {name: i for i, name in enumerate(_GEOM_NAMES)}
+_CONNECTIVITY = np.array([4, 3, 6, 5], dtype=np.int8)
+_HEAD_PROBS = np.array([0.218, 0.299, 0.386, 0.097])  # Match empirical distribution!
+# Normalized exactly as Generator.choice does, so sampling by inverse CDF
+# draws the same heads as rng.choice(4, p=_HEAD_PROBS)
+_HEAD_CDF = np.cumsum(_HEAD_PROBS)
+_HEAD_CDF /= _HEAD_CDF[-1]
+
+# Conversational phases in index order for the priming experiment, with
+# the baseline phase probabilities and the shift pentagonal priming
+# simulates: transformation up, integration compensating
+_PHASE_NAMES = ('transformation', 'generation', 'consumption', 'integration')
+_PRIMING_BASELINE = np.array([0.097, 0.218, 0.299, 0.386])
+_PRIMING_DELTA = np.array([+0.053, 0.0, 0.0, -0.053])
+# A zero-sum shift keeps the primed probabilities normalized
+if abs(_PRIMING_DELTA.sum()) > 1e-9:
+    raise ValueError("_PRIMING_DELTA must sum to zero")
+
+# Simulation parameters shared by the experiments and simulate_batch
+_TRANSFORMATION_RATE = 0.097  # The 9.7% bottleneck
+_SIM_MODELS = ('GPT-3.5', 'GPT-4', 'Claude', 'LLaMA', 'PaLM')
+_MODEL_SPREAD = 0.015 / 2  # std of the per-model transformation share
+_MODEL_CLIP = (0.05, 0.15)  # Keep reasonable
+_CORRELATION_STRENGTH = 0.75  # 0.75 for strong support
+_SIM_SEED = 42
+
+
+def _spawn_seeds(seed: int) -> List[np.random.SeedSequence]:
+    """
+    Seeds of independent streams for the simulations of experiments 1-3
+    and the correlation sample plotted in the figure
+    """
+    return np.random.SeedSequence(seed).spawn(4)
+
+
+# Simulation draws, compiled when numba is installed. numba's Generator
+# support reproduces NumPy's streams, so both paths give the same numbers
+
+@njit(cache=True)
+def _sim_head_distribution(rng, n_heads):
+    """Share of n_heads heads assigned to each geometry (experiment 1)"""
+    codes = np.searchsorted(_HEAD_CDF, rng.random(n_heads), side='right')
+    return np.bincount(codes, minlength=4) / n_heads
+
+
+@njit(cache=True)
+def _sim_model_percentages(rng, n_models):
+    """Transformation share per model around 9.7% (experiment 2)"""
+    pcts = _TRANSFORMATION_RATE + rng.normal(0.0, _MODEL_SPREAD, n_models)
+    return np.clip(pcts, _MODEL_CLIP[0], _MODEL_CLIP[1])
+
+
+@njit(cache=True)
+def _draw_correlated(n, corr, rng):
+    """Draw n (x, y) pairs with population correlation corr (experiment 3)"""
+    z = rng.standard_normal((2, n))
+    x = z[0]
+    y = corr * x
+    y += np.sqrt(1 - corr * corr) * z[1]
+    return x, y
+
+
+def _to_builtin(value):
+    """Deep copy of value with NumPy arrays and scalars as plain Python types"""
+    if isinstance(value, dict):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+class SimulationBatch(NamedTuple):
+    """Outcome of one seeded pass of the simulated experiments 1-3"""
+    distribution: np.ndarray       # share of heads per geometry, shape (4,)
+    model_percentages: np.ndarray  # transformation share per model, shape (5,)
+    correlation: float             # phase-geometry Pearson r
+
+
+def _run_sim_batch(seed: int, n_heads: int = 144, n_samples: int = 100) -> SimulationBatch:
+    """
+    Run the simulations of experiments 1-3 for one seed, on the same streams
+    GeometricValidationExperiments uses, so seed 42 reproduces its report
+    """
+    rngs = [np.random.default_rng(s) for s in _spawn_seeds(seed)]
+    x, y = _draw_correlated(n_samples, _CORRELATION_STRENGTH, rngs[2])
+    return SimulationBatch(
+        _sim_head_distribution(rngs[0], n_heads),
+        _sim_model_percentages(rngs[1], len(_SIM_MODELS)),
+        np.corrcoef(x, y)[0, 1]
+    )
+
+
 class GeometricValidationExperiments:
     """
     Experiments to validate or refute the geometric hypothesis.
     Each experiment clearly states what would support or refute the theory.
     """
     
-    def __init__(self):
+    # scipy.special distribution functions, imported on first use
+    _t_cdf = None
+    _chi2_sf = None
+    
+    def __init__(self, plot: bool = False, verbose: bool = True):
+        """
+        With plot=True each experiment draws its panel of the results
+        figure as soon as it completes, instead of in visualize_results.
+        With verbose=False nothing is printed; read the outcome from
+        to_dict() instead (e.g. when sweeping many runs).
+        """
+        self.plot = plot
+        self.verbose = verbose
         self.results = {}
+        self.supports = {}  # whether each completed experiment supports the hypothesis
+        self._priming = None  # memoized _simulate_priming result
+        self._seeds = _spawn_seeds(_SIM_SEED)
+        self._log = []  # report lines, written out once per experiment
+        self._fig, self._axes = None, None  # results figure, created lazily
+        self._plotted = set()  # experiments already drawn into the figure
         self.status = {
             'experiment_1': 'not_started',
             'experiment_2': 'not_started', 
@@ -42,69 +167,76 @@ class GeometricValidationExperiments:
         SUPPORT: Finding 4 distinct clusters with predicted connectivity
         REFUTE: Random connectivity or different number of clusters
         """
-        print("="*60)
-        print("EXPERIMENT 1: Attention Head Connectivity Analysis")
-        print("="*60)
-        print("Hypothesis: Attention heads organize into 4 geometric patterns")
-        print("Expected: Square(4), Triangular(3), Hexagonal(6), Pentagonal(5)")
+        self._log.append("="*60)
+        self._log.append("EXPERIMENT 1: Attention Head Connectivity Analysis")
+        self._log.append("="*60)
+        self._log.append("Hypothesis: Attention heads organize into 4 geometric patterns")
+        self._log.append("Expected: Square(4), Triangular(3), Hexagonal(6), Pentagonal(5)")
         
         if model is None:
-            print("\n⚠️ No model provided - using simulated data for demonstration")
-            results = self._simulate_attention_analysis()
+            self._log.append("\n⚠️ No model provided - using simulated data for demonstration")
+            results = self._simulate_attention_analysis(self._rng(0))
         else:
             results = self._analyze_real_attention(model)
         
         # Interpret results
-        print("\nResults:")
-        print(f"  Clusters found: {results['n_clusters']}")
-        print(f"  Connectivity patterns: {results['connectivity_patterns']}")
-        print(f"  Match to hypothesis: {results['matches_hypothesis']}")
-        
-        if results['matches_hypothesis']:
-            print("  ✅ SUPPORTS geometric hypothesis")
+        self._log.append("\nResults:")
+        self._log.append(f"  Clusters found: {results['n_clusters']}")
+        connectivity = dict(zip(_GEOM_NAMES, np.asarray(results['connectivity_patterns']).tolist()))
+        self._log.append(f"  Connectivity patterns: {connectivity}")
+        self._log.append(f"  Match to hypothesis: {results['matches_hypothesis']}")
+        
+        supports = bool(results['matches_hypothesis'])
+        if supports:
+            self._log.append("  ✅ SUPPORTS geometric hypothesis")
         else:
-            print("  ❌ REFUTES geometric hypothesis")
+            self._log.append("  ❌ REFUTES geometric hypothesis")
         
         self.results['experiment_1'] = results
+        self.supports['experiment_1'] = supports
         self.status['experiment_1'] = 'complete'
-        return results
+        if self.plot:
+            self._draw_panel(1)
+        self._flush_log()
+        return results, supports
     
-    def _simulate_attention_analysis(self) -> Dict:
+    def _simulate_attention_analysis(self, rng: np.random.Generator) -> Dict:
         """Simulated analysis for demonstration"""
-        # Simulate finding 4 clusters (supporting hypothesis)
-        np.random.seed(42)
+        # Simulate 4 clusters drawn from the empirical distribution; whether
+        # the pentagonal share lands within 2% of 9.7% depends on the draw
+        # (with the default streams it is 12.5%, which refutes)
         
         # Generate synthetic attention patterns
         n_heads = 144  # 12 layers × 12 heads
         
-        # Assign heads to geometric patterns (matching empirical distribution)
-        assignments = np.random.choice(
-            ['square', 'triangular', 'hexagonal', 'pentagonal'],
-            size=n_heads,
-            p=[0.218, 0.299, 0.386, 0.097]  # Match empirical distribution!
-        )
-        
-        connectivity = {
-            'square': 4,
-            'triangular': 3,
-            'hexagonal': 6,
-            'pentagonal': 5
-        }
-        
-        # Count distribution
-        distribution = {
-            geom: np.sum(assignments == geom) / n_heads 
-            for geom in connectivity.keys()
-        }
+        # Assign heads to geometric patterns (matching empirical
+        # distribution) and count them in a single pass
+        distribution = _sim_head_distribution(rng, n_heads)
         
         return {
             'n_clusters': 4,
-            'connectivity_patterns': connectivity,
+            'connectivity_patterns': _CONNECTIVITY,
             'distribution': distribution,
-            'pentagonal_percentage': distribution['pentagonal'],
-            'matches_hypothesis': abs(distribution['pentagonal'] - 0.097) < 0.02
+            'pentagonal_percentage': distribution[_GEOM_INDEX['pentagonal']],
+            'matches_hypothesis': abs(distribution[_GEOM_INDEX['pentagonal']] - _TRANSFORMATION_RATE) < 0.02
         }
     
+    def distribution_of(self, geometry: str) -> float:
+        """Share of attention heads with the given geometry in experiment 1"""
+        return self.results['experiment_1']['distribution'][_GEOM_INDEX[geometry]]
+    
+    def _rng(self, stream: int) -> np.random.Generator:
+        """A fresh Generator on the given stream, so reruns draw the same numbers"""
+        return np.random.default_rng(self._seeds[stream])
+    
+    def simulate_batch(self, seeds, n_heads: int = 144, n_samples: int = 100) -> List[SimulationBatch]:
+        """
+        Re-run the simulated experiments 1-3 once per seed, without printing.
+        Meant for power analyses and bootstraps over many seeds; seed 42
+        gives the numbers the experiments report.
+        """
+        return [_run_sim_batch(int(seed), n_heads, n_samples) for seed in seeds]
+    
     def _analyze_real_attention(self, model) -> Dict:
         """Analyze real model attention patterns"""
         # TODO: Implement actual attention analysis
@@ -113,7 +245,12 @@ class GeometricValidationExperiments:
         # 2. Compute connectivity patterns
         # 3. Cluster by geometric similarity
         # 4. Compare to predicted patterns
-        pass
+        # and return the keys of _simulate_attention_analysis, with
+        # per-geometry values (array or sequence) aligned to _GEOM_NAMES
+        raise NotImplementedError(
+            "Real attention analysis is not implemented yet; "
+            "call with model=None for the simulated analysis"
+        )
     
     # ========================================
     # EXPERIMENT 2: Cross-Model Validation
@@ -127,55 +264,48 @@ class GeometricValidationExperiments:
         SUPPORT: All models show ~10% transformation phase
         REFUTE: High variance or different patterns
         """
-        print("\n" + "="*60)
-        print("EXPERIMENT 2: Cross-Model Validation")
-        print("="*60)
-        print("Hypothesis: 9.7% bottleneck is universal")
-        print("Testing models:", models if models else "Simulated")
+        self._log.append("\n" + "="*60)
+        self._log.append("EXPERIMENT 2: Cross-Model Validation")
+        self._log.append("="*60)
+        self._log.append("Hypothesis: 9.7% bottleneck is universal")
+        self._log.append(f"Testing models: {models if models else 'Simulated'}")
         
         if models is None:
-            results = self._simulate_cross_model()
+            results = self._simulate_cross_model(self._rng(1))
         else:
             results = self._analyze_multiple_models(models)
         
-        print("\nResults:")
+        self._log.append("\nResults:")
         for model, percentage in results['transformation_percentages'].items():
-            status = "✓" if abs(percentage - 0.097) < 0.02 else "✗"
-            print(f"  {model}: {percentage:.1%} {status}")
+            status = "✓" if abs(percentage - _TRANSFORMATION_RATE) < 0.02 else "✗"
+            self._log.append(f"  {model}: {percentage:.1%} {status}")
         
-        print(f"\nMean: {results['mean']:.1%}")
-        print(f"Std Dev: {results['std']:.1%}")
+        self._log.append(f"\nMean: {results['mean']:.1%}")
+        self._log.append(f"Std Dev: {results['std']:.1%}")
         
-        if results['consistent']:
-            print("✅ SUPPORTS universality hypothesis")
+        supports = bool(results['consistent'])
+        if supports:
+            self._log.append("✅ SUPPORTS universality hypothesis")
         else:
-            print("❌ REFUTES universality hypothesis")
+            self._log.append("❌ REFUTES universality hypothesis")
         
         self.results['experiment_2'] = results
+        self.supports['experiment_2'] = supports
         self.status['experiment_2'] = 'complete'
-        return results
+        if self.plot:
+            self._draw_panel(2)
+        self._flush_log()
+        return results, supports
     
-    def _simulate_cross_model(self) -> Dict:
+    def _simulate_cross_model(self, rng: np.random.Generator) -> Dict:
         """Simulate cross-model analysis"""
-        np.random.seed(42)
-        
-        # Simulate different models showing similar patterns
-        # (with some variance)
-        models = ['GPT-3.5', 'GPT-4', 'Claude', 'LLaMA', 'PaLM']
+        # Simulate different models showing similar patterns, with
+        # percentages around 9.7% and small variance
+        pcts = _sim_model_percentages(rng, len(_SIM_MODELS))
+        percentages = dict(zip(_SIM_MODELS, pcts.tolist()))
         
-        # Generate percentages around 9.7% with small variance
-        base = 0.097
-        variance = 0.015
-        
-        percentages = {}
-        for model in models:
-            # Add noise but keep close to 9.7%
-            pct = base + np.random.normal(0, variance/2)
-            pct = np.clip(pct, 0.05, 0.15)  # Keep reasonable
-            percentages[model] = pct
-        
-        mean = np.mean(list(percentages.values()))
-        std = np.std(list(percentages.values()))
+        mean = pcts.mean()
+        std = pcts.std()
         
         return {
             'transformation_percentages': percentages,
@@ -201,49 +331,54 @@ class GeometricValidationExperiments:
         SUPPORT: Correlation > 0.7
         REFUTE: Correlation < 0.3 or negative
         """
-        print("\n" + "="*60)
-        print("EXPERIMENT 3: Phase-Geometry Correlation")
-        print("="*60)
-        print("Hypothesis: Phases correlate with geometric attention patterns")
+        self._log.append("\n" + "="*60)
+        self._log.append("EXPERIMENT 3: Phase-Geometry Correlation")
+        self._log.append("="*60)
+        self._log.append("Hypothesis: Phases correlate with geometric attention patterns")
         
         if conversation_data is None:
-            results = self._simulate_correlation()
+            results = self._simulate_correlation(self._rng(2))
         else:
             results = self._analyze_correlation(conversation_data)
         
-        print("\nResults:")
-        print(f"  Correlation coefficient: {results['correlation']:.3f}")
-        print(f"  P-value: {results['p_value']:.4f}")
-        print(f"  Significant: {results['significant']}")
+        self._log.append("\nResults:")
+        self._log.append(f"  Correlation coefficient: {results['correlation']:.3f}")
+        self._log.append(f"  P-value: {results['p_value']:.4f}")
+        self._log.append(f"  Significant: {results['significant']}")
         
-        if results['correlation'] > 0.7:
-            print("✅ STRONG SUPPORT for geometric hypothesis")
+        supports = bool(results['correlation'] > 0.7)
+        if supports:
+            self._log.append("✅ STRONG SUPPORT for geometric hypothesis")
         elif results['correlation'] > 0.3:
-            print("⚠️ WEAK SUPPORT for geometric hypothesis")
+            self._log.append("⚠️ WEAK SUPPORT for geometric hypothesis")
         else:
-            print("❌ REFUTES geometric hypothesis")
+            self._log.append("❌ REFUTES geometric hypothesis")
         
         self.results['experiment_3'] = results
+        self.supports['experiment_3'] = supports
         self.status['experiment_3'] = 'complete'
-        return results
+        if self.plot:
+            self._draw_panel(3)
+        self._flush_log()
+        return results, supports
     
-    def _simulate_correlation(self) -> Dict:
+    def _simulate_correlation(self, rng: np.random.Generator) -> Dict:
         """Simulate correlation analysis"""
-        np.random.seed(42)
-        
         # Generate synthetic data with correlation
         n_samples = 100
         
         # Create correlated phase and geometry scores
-        phase_scores = np.random.randn(n_samples)
-        
-        # Add correlation (0.75 for strong support)
-        correlation_strength = 0.75
-        geometry_scores = correlation_strength * phase_scores + \
-                         np.sqrt(1 - correlation_strength**2) * np.random.randn(n_samples)
+        phase_scores, geometry_scores = self._make_correlated(
+            n_samples, _CORRELATION_STRENGTH, rng
+        )
         
-        # Calculate correlation
-        corr, p_value = stats.pearsonr(phase_scores, geometry_scores)
+        # Calculate correlation (same r and two-sided p-value as pearsonr)
+        corr = np.corrcoef(phase_scores, geometry_scores)[0, 1]
+        t = corr * np.sqrt((n_samples - 2) / (1 - corr * corr))
+        if GeometricValidationExperiments._t_cdf is None:
+            from scipy.special import stdtr
+            GeometricValidationExperiments._t_cdf = staticmethod(stdtr)
+        p_value = 2 * self._t_cdf(n_samples - 2, -abs(t))
         
         return {
             'correlation': corr,
@@ -252,6 +387,8 @@ class GeometricValidationExperiments:
             'n_samples': n_samples
         }
     
+    _make_correlated = staticmethod(_draw_correlated)
+    
     # ========================================
     # EXPERIMENT 4: Geometric Priming
     # ========================================
@@ -264,56 +401,61 @@ class GeometricValidationExperiments:
         SUPPORT: Significant shift after priming
         REFUTE: No change or random changes
         """
-        print("\n" + "="*60)
-        print("EXPERIMENT 4: Geometric Priming Effects")
-        print("="*60)
-        print("Hypothesis: Geometric priming can shift phase distributions")
+        self._log.append("\n" + "="*60)
+        self._log.append("EXPERIMENT 4: Geometric Priming Effects")
+        self._log.append("="*60)
+        self._log.append("Hypothesis: Geometric priming can shift phase distributions")
         
         results = self._simulate_priming()
         
-        print("\nResults:")
-        print("  Baseline vs Primed:")
-        for phase in results['baseline'].keys():
-            base = results['baseline'][phase]
-            primed = results['primed'][phase]
+        self._log.append("\nResults:")
+        self._log.append("  Baseline vs Primed:")
+        for phase, base, primed in zip(_PHASE_NAMES, results['baseline'], results['primed']):
             change = primed - base
-            print(f"    {phase}: {base:.1%} → {primed:.1%} ({change:+.1%})")
+            self._log.append(f"    {phase}: {base:.1%} → {primed:.1%} ({change:+.1%})")
         
-        if results['significant_shift']:
-            print("\n✅ SUPPORTS geometric influence hypothesis")
+        supports = bool(results['significant_shift'])
+        if supports:
+            self._log.append("\n✅ SUPPORTS geometric influence hypothesis")
         else:
-            print("\n❌ REFUTES geometric influence hypothesis")
+            self._log.append("\n❌ REFUTES geometric influence hypothesis")
         
         self.results['experiment_4'] = results
+        self.supports['experiment_4'] = supports
         self.status['experiment_4'] = 'complete'
-        return results
+        if self.plot:
+            self._draw_panel(4)
+        self._flush_log()
+        return results, supports
     
     def _simulate_priming(self) -> Dict:
         """Simulate priming experiment"""
-        baseline = {
-            'transformation': 0.097,
-            'generation': 0.218,
-            'consumption': 0.299,
-            'integration': 0.386
-        }
+        # The simulated inputs are fixed, so compute the test only once
+        if self._priming is not None:
+            return self._priming
+        
+        # Phase probabilities aligned to _PHASE_NAMES
+        baseline = _PRIMING_BASELINE.copy()
         
         # Simulate pentagonal priming increasing transformation
-        primed = baseline.copy()
-        primed['transformation'] = 0.15  # Increased!
-        primed['integration'] = 0.336  # Decreased to compensate
+        primed = baseline + _PRIMING_DELTA
         
-        # Chi-square test for significance
-        baseline_counts = [int(p * 1000) for p in baseline.values()]
-        primed_counts = [int(p * 1000) for p in primed.values()]
-        chi2, p_value = stats.chisquare(primed_counts, baseline_counts)
+        # Chi-square test for significance (Pearson statistic over 1000 samples)
+        expected = baseline * 1000
+        chi2 = ((primed * 1000 - expected)**2 / expected).sum()
+        if GeometricValidationExperiments._chi2_sf is None:
+            from scipy.special import chdtrc
+            GeometricValidationExperiments._chi2_sf = staticmethod(chdtrc)
+        p_value = self._chi2_sf(len(baseline) - 1, chi2)
         
-        return {
+        self._priming = {
             'baseline': baseline,
             'primed': primed,
             'chi_square': chi2,
             'p_value': p_value,
             'significant_shift': p_value < 0.05
         }
+        return self._priming
     
     # ========================================
     # RUN ALL EXPERIMENTS
@@ -321,118 +463,176 @@ class GeometricValidationExperiments:
     
     def run_all_experiments(self):
         """Run all validation experiments"""
-        print("RUNNING COMPLETE VALIDATION SUITE")
-        print("="*60)
+        self._log.append("RUNNING COMPLETE VALIDATION SUITE")
+        self._log.append("="*60)
         
-        # Run each experiment
-        self.experiment_1_attention_connectivity()
-        self.experiment_2_cross_model_validation()
-        self.experiment_3_phase_geometry_correlation()
-        self.experiment_4_geometric_priming()
+        # Run each experiment, counting those that support the hypothesis
+        support_count = sum(experiment()[1] for experiment in (
+            self.experiment_1_attention_connectivity,
+            self.experiment_2_cross_model_validation,
+            self.experiment_3_phase_geometry_correlation,
+            self.experiment_4_geometric_priming
+        ))
         
         # Summarize results
-        print("\n" + "="*60)
-        print("VALIDATION SUMMARY")
-        print("="*60)
-        
-        support_count = 0
-        for exp_name, result in self.results.items():
-            if 'matches_hypothesis' in result and result['matches_hypothesis']:
-                support_count += 1
-                print(f"✅ {exp_name}: SUPPORTS hypothesis")
-            elif 'consistent' in result and result['consistent']:
-                support_count += 1
-                print(f"✅ {exp_name}: SUPPORTS hypothesis")
-            elif 'correlation' in result and result['correlation'] > 0.7:
-                support_count += 1
-                print(f"✅ {exp_name}: SUPPORTS hypothesis")
-            elif 'significant_shift' in result and result['significant_shift']:
-                support_count += 1
-                print(f"✅ {exp_name}: SUPPORTS hypothesis")
+        self._log.append("\n" + "="*60)
+        self._log.append("VALIDATION SUMMARY")
+        self._log.append("="*60)
+        
+        for exp_name, supports in self.supports.items():
+            if supports:
+                self._log.append(f"✅ {exp_name}: SUPPORTS hypothesis")
             else:
-                print(f"❌ {exp_name}: REFUTES hypothesis")
+                self._log.append(f"❌ {exp_name}: REFUTES hypothesis")
         
-        print(f"\nOverall: {support_count}/4 experiments support geometric hypothesis")
+        self._log.append(f"\nOverall: {support_count}/4 experiments support geometric hypothesis")
         
         if support_count >= 3:
-            print("🎉 STRONG SUPPORT for Multi-Geometric Attention Theory!")
+            self._log.append("🎉 STRONG SUPPORT for Multi-Geometric Attention Theory!")
         elif support_count >= 2:
-            print("⚠️ MIXED EVIDENCE - needs further investigation")
+            self._log.append("⚠️ MIXED EVIDENCE - needs further investigation")
         else:
-            print("❌ HYPOTHESIS LIKELY INCORRECT - consider alternatives")
+            self._log.append("❌ HYPOTHESIS LIKELY INCORRECT - consider alternatives")
         
+        self._flush_log()
         return self.results
     
+    def _flush_log(self):
+        """Write the buffered report lines to stdout in one call"""
+        if self._log and self.verbose:
+            sys.stdout.write("\n".join(self._log) + "\n")
+        self._log.clear()
+    
+    def to_dict(self) -> Dict:
+        """
+        Structured summary of all experiments run so far, as a copy in
+        plain Python types (JSON-serializable)
+        """
+        return _to_builtin({
+            'results': self.results,
+            'status': self.status,
+            'supports': self.supports,
+            'support_count': sum(self.supports.values())
+        })
+    
+    def to_json(self, **kwargs) -> str:
+        """to_dict() serialized with json.dumps(**kwargs)"""
+        return json.dumps(self.to_dict(), **kwargs)
+    
+    def __repr__(self) -> str:
+        complete = sum(state == 'complete' for state in self.status.values())
+        return (f"{type(self).__name__}({complete}/{len(self.status)} experiments complete, "
+                f"{sum(self.supports.values())} support the hypothesis)")
+    
+    # ========================================
+    # VISUALIZATION
+    # ========================================
+    
+    @staticmethod
+    def _pyplot():
+        """
+        Import pyplot on first use, so running the experiments never pays
+        for matplotlib. The backend is left to matplotlib (MPLBACKEND,
+        inline, or its own Agg fallback when there is no display)
+        """
+        import matplotlib.pyplot as plt
+        return plt
+    
+    def _figure(self):
+        """The shared 2x2 results figure, created on first use"""
+        if self._fig is None:
+            plt = self._pyplot()
+            self._fig, self._axes = plt.subplots(2, 2, figsize=(12, 10))
+            self._fig.suptitle('Multi-Geometric Attention Theory - Validation Results', fontsize=14, fontweight='bold')
+        return self._fig
+    
+    def _draw_panel(self, n: int):
+        """Draw experiment n's panel into the shared results figure, once"""
+        name = f'experiment_{n}'
+        if name not in self.results or name in self._plotted:
+            return
+        self._figure()
+        getattr(self, f'_plot_{name}')(self._axes.flat[n - 1])
+        self._plotted.add(name)
+    
+    def _plot_experiment_1(self, ax1):
+        """Experiment 1: Attention patterns"""
+        geometries = _GEOM_NAMES
+        percentages = 100.0 * self.results['experiment_1']['distribution']
+        colors = ['#3498db', '#f39c12', '#2ecc71', '#e74c3c']
+        
+        ax1.bar(geometries, percentages, color=colors)
+        ax1.set_ylabel('Percentage of Attention Heads')
+        ax1.set_title('Exp 1: Geometric Distribution in Attention')
+        ax1.axhline(y=9.7, color='red', linestyle='--', label='9.7% target')
+        ax1.legend()
+    
+    def _plot_experiment_2(self, ax2):
+        """Experiment 2: Cross-model"""
+        transformation = self.results['experiment_2']['transformation_percentages']
+        models = list(transformation.keys())
+        percentages = 100.0 * np.fromiter(transformation.values(), dtype=np.float64, count=len(transformation))
+        
+        ax2.bar(models, percentages)
+        ax2.axhline(y=9.7, color='red', linestyle='--', label='9.7% target')
+        ax2.set_ylabel('Transformation %')
+        ax2.set_title('Exp 2: Cross-Model Validation')
+        ax2.legend()
+        ax2.tick_params(axis='x', rotation=45)
+    
+    def _plot_experiment_3(self, ax3):
+        """Experiment 3: Correlation"""
+        # Simulate correlation plot
+        corr = self.results['experiment_3']['correlation']
+        x, y = self._make_correlated(50, corr, self._rng(3))
+        
+        ax3.scatter(x, y, alpha=0.6)
+        ax3.set_xlabel('Phase Score')
+        ax3.set_ylabel('Geometric Score')
+        ax3.set_title(f'Exp 3: Phase-Geometry Correlation (r={corr:.2f})')
+        
+        # Add least-squares trend line
+        slope = np.cov(x, y, ddof=0)[0, 1] / x.var()
+        intercept = y.mean() - slope * x.mean()
+        ax3.plot(x, slope * x + intercept, "r--", alpha=0.8)
+    
+    def _plot_experiment_4(self, ax4):
+        """Experiment 4: Priming effects"""
+        baseline_pct = 100.0 * self.results['experiment_4']['baseline']
+        primed_pct = 100.0 * self.results['experiment_4']['primed']
+        phases = ['Transform', 'Generate', 'Consume', 'Integrate']
+        
+        x = np.arange(len(phases))
+        width = 0.35
+        
+        ax4.bar(x - width/2, baseline_pct, width, label='Baseline', color='blue', alpha=0.7)
+        ax4.bar(x + width/2, primed_pct, width, label='After Priming', color='red', alpha=0.7)
+        ax4.set_xlabel('Phase')
+        ax4.set_ylabel('Percentage')
+        ax4.set_title('Exp 4: Geometric Priming Effects')
+        ax4.set_xticks(x)
+        ax4.set_xticklabels(phases)
+        ax4.legend()
+    
+    def _finish_figure(self):
+        """Draw any panels not yet rendered and lay out the figure"""
+        for n in range(1, 5):
+            self._draw_panel(n)
+        fig = self._figure()
+        fig.tight_layout()
+        return fig
+    
     def visualize_results(self):
         """Create visualization of validation results"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
-        
-        # Experiment 1: Attention patterns
-        if 'experiment_1' in self.results:
-            dist = self.results['experiment_1']['distribution']
-            geometries = list(dist.keys())
-            percentages = [dist[g] * 100 for g in geometries]
-            colors = ['#3498db', '#f39c12', '#2ecc71', '#e74c3c']
-            
-            bars = ax1.bar(geometries, percentages, color=colors)
-            ax1.set_ylabel('Percentage of Attention Heads')
-            ax1.set_title('Exp 1: Geometric Distribution in Attention')
-            ax1.axhline(y=9.7, color='red', linestyle='--', label='9.7% target')
-            ax1.legend()
-        
-        # Experiment 2: Cross-model
-        if 'experiment_2' in self.results:
-            models = list(self.results['experiment_2']['transformation_percentages'].keys())
-            percentages = [p * 100 for p in self.results['experiment_2']['transformation_percentages'].values()]
-            
-            ax2.bar(models, percentages)
-            ax2.axhline(y=9.7, color='red', linestyle='--', label='9.7% target')
-            ax2.set_ylabel('Transformation %')
-            ax2.set_title('Exp 2: Cross-Model Validation')
-            ax2.legend()
-            ax2.tick_params(axis='x', rotation=45)
-        
-        # Experiment 3: Correlation
-        if 'experiment_3' in self.results:
-            # Simulate correlation plot
-            np.random.seed(42)
-            n = 50
-            corr = self.results['experiment_3']['correlation']
-            x = np.random.randn(n)
-            y = corr * x + np.sqrt(1 - corr**2) * np.random.randn(n)
-            
-            ax3.scatter(x, y, alpha=0.6)
-            ax3.set_xlabel('Phase Score')
-            ax3.set_ylabel('Geometric Score')
-            ax3.set_title(f'Exp 3: Phase-Geometry Correlation (r={corr:.2f})')
-            
-            # Add trend line
-            z = np.polyfit(x, y, 1)
-            p = np.poly1d(z)
-            ax3.plot(x, p(x), "r--", alpha=0.8)
-        
-        # Experiment 4: Priming effects
-        if 'experiment_4' in self.results:
-            baseline = list(self.results['experiment_4']['baseline'].values())
-            primed = list(self.results['experiment_4']['primed'].values())
-            phases = ['Transform', 'Generate', 'Consume', 'Integrate']
-            
-            x = np.arange(len(phases))
-            width = 0.35
-            
-            ax4.bar(x - width/2, [b*100 for b in baseline], width, label='Baseline', color='blue', alpha=0.7)
-            ax4.bar(x + width/2, [p*100 for p in primed], width, label='After Priming', color='red', alpha=0.7)
-            ax4.set_xlabel('Phase')
-            ax4.set_ylabel('Percentage')
-            ax4.set_title('Exp 4: Geometric Priming Effects')
-            ax4.set_xticks(x)
-            ax4.set_xticklabels(phases)
-            ax4.legend()
-        
-        plt.suptitle('Multi-Geometric Attention Theory - Validation Results', fontsize=14, fontweight='bold')
-        plt.tight_layout()
-        plt.show()
-
+        self._finish_figure()
+        self._pyplot().show()
+    
+    def save_figure(self, path: str):
+        """Save the validation results figure to path and release it"""
+        self._finish_figure().savefig(path, dpi=100, bbox_inches='tight')
+        self._pyplot().close(self._fig)
+        self._fig, self._axes = None, None
+        self._plotted.clear()
 
 # ========================================
 # USAGE EXAMPLE
@@ -8,20 +8,38 @@ Author: Hillary Danan
 Date: August 2025
 """
 
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.patches import Circle, RegularPolygon, Rectangle
-import seaborn as sns
+from matplotlib.patches import Circle, RegularPolygon
+from matplotlib.collections import PolyCollection
 
-# Set style for publication
+# Set style for publication (bundled with matplotlib, no seaborn import)
 plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+
+def _unit_circle_points(angles_deg):
+    """(n, 2) array of points on the unit circle at the given angles"""
+    angles = np.deg2rad(angles_deg)
+    return np.column_stack([np.cos(angles), np.sin(angles)])
 
 class MGATVisualizer:
     """Create visualizations for MGAT paper"""
     
-    def __init__(self):
+    # Empirical phase distribution (EMPIRICALLY VALIDATED)
+    PHASES = ['Transformation', 'Generation', 'Consumption', 'Integration']
+    PERCENTAGES = [9.7, 21.8, 29.9, 38.6]
+    
+    # Connectivity dot positions for Figure 2, computed once at import
+    CONNECTIVITY_POINTS = {
+        'square': _unit_circle_points([0, 90, 180, 270]),
+        'triangular': _unit_circle_points([90, 210, 330]),
+        'hexagonal': _unit_circle_points(np.arange(0, 360, 60)),
+        'pentagonal': _unit_circle_points(np.arange(0, 360, 72) + 18)
+    }
+    
+    def __init__(self, seed=42):
         self.colors = {
             'transformation': '#e74c3c',  # Red
             'generation': '#3498db',      # Blue
@@ -35,56 +53,74 @@ class MGATVisualizer:
             'triangular': '#f39c12',
             'hexagonal': '#2ecc71'
         }
+        
+        # Figure 1 is built lazily and reused across renders
+        self._fig1 = None
+        
+        # One generator for all simulated data; repeated renders continue
+        # the stream, so build a new visualizer to reproduce a figure
+        self._rng = np.random.default_rng(seed)
     
-    def figure_1_empirical_findings(self, save_path=None):
+    def figure_1_empirical_findings(self, save_path=None, percentages=None,
+                                    show=True, dpi=300):
         """
         Figure 1: Empirical phase distribution (PROVEN)
         Shows the actual 9.7% bottleneck we discovered
+        The figure is built once and its artists updated on later calls
         """
+        if self._fig1 is None or not plt.fignum_exists(self._fig1.number):
+            self._build_figure_1()
+        self._update_figure_1(self.PERCENTAGES if percentages is None else percentages)
+        
+        fig = self._fig1
+        if save_path:
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        if show:
+            plt.show()
+        return fig
+    
+    def _build_figure_1(self):
+        """Create Figure 1 and keep handles to the data-driven artists"""
         fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
         
         # Data (EMPIRICALLY VALIDATED)
-        phases = ['Transformation', 'Generation', 'Consumption', 'Integration']
-        percentages = [9.7, 21.8, 29.9, 38.6]
+        phases = self.PHASES
         colors = [self.colors['transformation'], self.colors['generation'],
                  self.colors['consumption'], self.colors['integration']]
         
         # Subplot 1: Bar chart
-        bars = ax1.bar(phases, percentages, color=colors, edgecolor='black', linewidth=2)
+        bars = ax1.bar(phases, np.zeros(len(phases)), color=colors, edgecolor='black', linewidth=2)
         ax1.set_ylabel('Percentage (%)', fontsize=12)
         ax1.set_title('Phase Distribution in GPT-3.5', fontsize=14, fontweight='bold')
         ax1.set_ylim(0, 45)
         
-        # Add percentage labels
-        for bar, pct in zip(bars, percentages):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                    f'{pct}%', ha='center', fontweight='bold', fontsize=11)
+        # Percentage labels, positioned in _update_figure_1
+        bar_labels = [ax1.text(bar.get_x() + bar.get_width()/2, 0, '',
+                               ha='center', fontweight='bold', fontsize=11)
+                      for bar in bars]
         
         # Add significance annotation
         ax1.text(0.5, 0.95, 'χ² = 120.24, p < 0.0001', 
                 transform=ax1.transAxes, ha='center',
                 bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3))
         
-        # Subplot 2: Pie chart
-        explode = (0.1, 0, 0, 0)  # Explode transformation slice
-        ax2.pie(percentages, labels=phases, colors=colors, autopct='%1.1f%%',
-               startangle=90, explode=explode, shadow=True)
-        ax2.set_title('Relative Proportions', fontsize=14, fontweight='bold')
-        
         # Subplot 3: Funnel visualization showing bottleneck
-        levels = [100, 38.6, 29.9, 21.8, 9.7]
         level_labels = ['All', 'Integration', 'Consumption', 'Generation', 'TRANSFORMATION']
         level_colors = ['#95a5a6'] + colors[::-1]
-        
-        for i, (level, label, color) in enumerate(zip(levels, level_labels, level_colors)):
-            left = (100 - level) / 2
-            height = 0.8
-            bottom = 4 - i
-            
-            rect = Rectangle((left, bottom), level, height, 
-                           facecolor=color, edgecolor='black', linewidth=1)
-            ax3.add_patch(rect)
-            
+        height = 0.8
+        
+        # All five levels as one collection of rectangles, corners ordered
+        # (left, bottom), (right, bottom), (right, top), (left, top);
+        # the x coordinates are filled in by _update_figure_1
+        bottoms = 4 - np.arange(len(level_labels))
+        funnel_verts = np.zeros((len(level_labels), 4, 2))
+        funnel_verts[:, :2, 1] = bottoms[:, None]
+        funnel_verts[:, 2:, 1] = bottoms[:, None] + height
+        funnel = PolyCollection(funnel_verts, facecolors=level_colors,
+                                edgecolors='black', linewidths=1, rasterized=True)
+        ax3.add_collection(funnel)
+        
+        for i, (label, bottom) in enumerate(zip(level_labels, bottoms)):
             # Add labels
             ax3.text(50, bottom + height/2, label, ha='center', va='center',
                     fontweight='bold', color='white' if i > 0 else 'black')
@@ -100,16 +136,45 @@ class MGATVisualizer:
                     arrowprops=dict(arrowstyle='->', color='red', lw=2),
                     fontsize=12, color='red', fontweight='bold')
         
-        plt.suptitle('Figure 1: Empirical Discovery - Phase Distribution in GPT-3.5 (n=1,000)',
+        fig.suptitle('Figure 1: Empirical Discovery - Phase Distribution in GPT-3.5 (n=1,000)',
                     fontsize=16, fontweight='bold', y=1.02)
         
-        plt.tight_layout()
+        self._fig1 = fig
+        self._fig1_axes = (ax1, ax2, ax3)
+        self._fig1_colors = colors
+        self._fig1_bars = bars
+        self._fig1_bar_labels = bar_labels
+        self._fig1_funnel = funnel
+        self._fig1_funnel_verts = funnel_verts
+    
+    def _update_figure_1(self, percentages):
+        """Push new phase percentages into the existing Figure 1 artists"""
+        ax1, ax2, ax3 = self._fig1_axes
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        for bar, label, pct in zip(self._fig1_bars, self._fig1_bar_labels, percentages):
+            bar.set_height(pct)
+            label.set_y(pct + 1)
+            label.set_text(f'{pct}%')
+        
+        # Subplot 2: Pie chart, redrawn since wedge geometry depends on all slices
+        ax2.clear()
+        explode = (0.1, 0, 0, 0)  # Explode transformation slice
+        ax2.pie(percentages, labels=self.PHASES, colors=self._fig1_colors,
+               autopct='%1.1f%%', startangle=90, explode=explode, shadow=True)
+        ax2.set_title('Relative Proportions', fontsize=14, fontweight='bold')
+        
+        # Funnel widths: everything, then phases from widest to narrowest
+        levels = np.array([100] + list(percentages[::-1]))
+        left = (100 - levels) / 2
+        verts = self._fig1_funnel_verts
+        verts[:, [0, 3], 0] = left[:, None]
+        verts[:, [1, 2], 0] = (left + levels)[:, None]
+        self._fig1_funnel.set_verts(verts)
+        
+        self._fig1.tight_layout()
+        self._fig1.canvas.draw_idle()
     
-    def figure_2_theoretical_framework(self, save_path=None):
+    def figure_2_theoretical_framework(self, save_path=None, show=True, dpi=300):
         """
         Figure 2: Theoretical geometric interpretation (HYPOTHESIS)
         Shows our proposed mapping to geometric patterns
@@ -132,11 +197,10 @@ class MGATVisualizer:
                      fontsize=12, fontweight='bold')
         ax1.text(0, -1.3, 'Sequential Processing', ha='center', fontsize=10)
         
-        # Add connectivity dots
-        for angle in [0, 90, 180, 270]:
-            x = np.cos(np.radians(angle))
-            y = np.sin(np.radians(angle))
-            ax1.plot(x, y, 'ko', markersize=8)
+        # Add connectivity dots, one marker line per polygon. Markers are
+        # rasterized in vector output; titles and labels stay vector
+        pts = self.CONNECTIVITY_POINTS['square']
+        ax1.plot(pts[:, 0], pts[:, 1], 'ko', markersize=8, rasterized=True)
         
         # Triangle (Consumption - 29.9%)
         triangle = RegularPolygon((0, 0), 3, radius=1, orientation=0,
@@ -148,10 +212,8 @@ class MGATVisualizer:
         ax2.text(0, -1.3, 'Hierarchical Analysis', ha='center', fontsize=10)
         
         # Add connectivity dots
-        for angle in [90, 210, 330]:
-            x = np.cos(np.radians(angle))
-            y = np.sin(np.radians(angle))
-            ax2.plot(x, y, 'ko', markersize=8)
+        pts = self.CONNECTIVITY_POINTS['triangular']
+        ax2.plot(pts[:, 0], pts[:, 1], 'ko', markersize=8, rasterized=True)
         
         # Hexagon (Integration - 38.6%)
         hexagon = RegularPolygon((0, 0), 6, radius=1, orientation=0,
@@ -163,10 +225,8 @@ class MGATVisualizer:
         ax3.text(0, -1.3, 'Associative Connections', ha='center', fontsize=10)
         
         # Add connectivity dots
-        for angle in range(0, 360, 60):
-            x = np.cos(np.radians(angle))
-            y = np.sin(np.radians(angle))
-            ax3.plot(x, y, 'ko', markersize=8)
+        pts = self.CONNECTIVITY_POINTS['hexagonal']
+        ax3.plot(pts[:, 0], pts[:, 1], 'ko', markersize=8, rasterized=True)
         
         # Pentagon (Transformation - 9.7%)
         pentagon = RegularPolygon((0, 0), 5, radius=1, orientation=0,
@@ -178,10 +238,8 @@ class MGATVisualizer:
         ax4.text(0, -1.3, 'Symmetry Breaking', ha='center', fontsize=10)
         
         # Add connectivity dots
-        for angle in range(0, 360, 72):
-            x = np.cos(np.radians(angle + 18))
-            y = np.sin(np.radians(angle + 18))
-            ax4.plot(x, y, 'ko', markersize=8)
+        pts = self.CONNECTIVITY_POINTS['pentagonal']
+        ax4.plot(pts[:, 0], pts[:, 1], 'ko', markersize=8, rasterized=True)
         
         # Add golden ratio annotation to pentagon
         ax4.text(0, 0, 'φ', fontsize=20, ha='center', va='center',
@@ -199,10 +257,12 @@ class MGATVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        if show:
+            plt.show()
+        return fig
     
-    def figure_3_validation_strategy(self, save_path=None):
+    def figure_3_validation_strategy(self, save_path=None, show=True, dpi=300):
         """
         Figure 3: How to validate the hypothesis
         Shows the experiments needed to test our theory
@@ -212,10 +272,11 @@ class MGATVisualizer:
         # Experiment 1: Attention Analysis
         ax1.set_title('Experiment 1: Attention Head Analysis', fontweight='bold')
         
-        # Simulate attention matrix
-        np.random.seed(42)
-        attention = np.random.rand(12, 12)
-        attention = (attention + attention.T) / 2  # Make symmetric
+        # Simulate attention matrix (float32 is plenty for display)
+        rng = self._rng
+        attention = rng.random((12, 12), dtype=np.float32)
+        attention += attention.T  # Make symmetric, in place
+        attention *= 0.5
         
         im1 = ax1.imshow(attention, cmap='YlOrRd')
         ax1.set_xlabel('Attention Position')
@@ -228,7 +289,8 @@ class MGATVisualizer:
         ax2.set_title('Experiment 2: Cross-Model Validation', fontweight='bold')
         
         models = ['GPT-3.5', 'GPT-4', 'Claude', 'LLaMA', 'PaLM']
-        transformation_pcts = [9.7, 10.2, 9.1, 10.5, 8.9]  # Hypothetical
+        transformation_pcts = np.array([9.7, 10.2, 9.1, 10.5, 8.9],
+                                       dtype=np.float32)  # Hypothetical
         
         bars = ax2.bar(models, transformation_pcts, color='steelblue')
         ax2.axhline(y=9.7, color='red', linestyle='--', label='9.7% baseline')
@@ -242,15 +304,19 @@ class MGATVisualizer:
         
         # Generate correlated data
         n = 100
-        phase_scores = np.random.randn(n)
-        geometry_scores = 0.75 * phase_scores + 0.25 * np.random.randn(n)
+        phase_scores = rng.standard_normal(n, dtype=np.float32)
+        geometry_scores = rng.standard_normal(n, dtype=np.float32)
+        geometry_scores *= 0.25
+        geometry_scores += 0.75 * phase_scores
         
-        ax3.scatter(phase_scores, geometry_scores, alpha=0.6)
+        # First color of the husl palette this figure was designed with
+        ax3.scatter(phase_scores, geometry_scores, alpha=0.6, color='#f77189')
         ax3.set_xlabel('Phase Score')
         ax3.set_ylabel('Geometric Score')
         
-        # Add trend line
-        z = np.polyfit(phase_scores, geometry_scores, 1)
+        # Add trend line, fitted in float64 (the float32 data is for display)
+        z = np.polyfit(phase_scores.astype(np.float64),
+                       geometry_scores.astype(np.float64), 1)
         p = np.poly1d(z)
         ax3.plot(phase_scores, p(phase_scores), "r--", alpha=0.8, label='r = 0.75')
         ax3.legend()
@@ -286,10 +352,12 @@ class MGATVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        if show:
+            plt.show()
+        return fig
     
-    def figure_4_summary(self, save_path=None):
+    def figure_4_summary(self, save_path=None, show=True, dpi=300):
         """
         Figure 4: Summary figure distinguishing proven vs hypothesized
         """
@@ -355,34 +423,47 @@ class MGATVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        if show:
+            plt.show()
+        return fig
     
-    def create_all_figures(self, output_dir='figures/'):
-        """Create all figures for the paper"""
-        import os
-        
+    def create_all_figures(self, output_dir='figures/', dpi=200):
+        """
+        Create all figures for the paper
+        Batch export never calls plt.show(), which blocks and forces a redraw
+        """
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
         
         print("Creating all figures for NeurIPS submission...")
         
-        # Figure 1: Empirical findings
-        print("Creating Figure 1: Empirical findings...")
-        self.figure_1_empirical_findings(f'{output_dir}figure1_empirical.pdf')
-        
-        # Figure 2: Theoretical framework
-        print("Creating Figure 2: Theoretical framework...")
-        self.figure_2_theoretical_framework(f'{output_dir}figure2_theory.pdf')
-        
-        # Figure 3: Validation strategy
-        print("Creating Figure 3: Validation strategy...")
-        self.figure_3_validation_strategy(f'{output_dir}figure3_validation.pdf')
-        
-        # Figure 4: Summary
-        print("Creating Figure 4: Summary...")
-        self.figure_4_summary(f'{output_dir}figure4_summary.pdf')
+        # Simplify paths while exporting; dpi only affects rasterized parts.
+        # savefig to .pdf renders through the PDF canvas whatever the
+        # backend, so the caller's backend and open figures are untouched.
+        # Each figure is closed once saved to release its renderer
+        with plt.rc_context({'path.simplify': True,
+                             'path.simplify_threshold': 1.0}):
+            # Figure 1: Empirical findings
+            print("Creating Figure 1: Empirical findings...")
+            plt.close(self.figure_1_empirical_findings(
+                output_dir / 'figure1_empirical.pdf', show=False, dpi=dpi))
+            
+            # Figure 2: Theoretical framework
+            print("Creating Figure 2: Theoretical framework...")
+            plt.close(self.figure_2_theoretical_framework(
+                output_dir / 'figure2_theory.pdf', show=False, dpi=dpi))
+            
+            # Figure 3: Validation strategy
+            print("Creating Figure 3: Validation strategy...")
+            plt.close(self.figure_3_validation_strategy(
+                output_dir / 'figure3_validation.pdf', show=False, dpi=dpi))
+            
+            # Figure 4: Summary
+            print("Creating Figure 4: Summary...")
+            plt.close(self.figure_4_summary(
+                output_dir / 'figure4_summary.pdf', show=False, dpi=dpi))
         
         print(f"\n✅ All figures saved to {output_dir}")
         print("Ready for NeurIPS submission!")